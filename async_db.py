@@ -0,0 +1,126 @@
+"""
+async_db.py
+
+Runs portal queries on worker threads so the QGIS GUI thread never waits on
+the database. Every task checks a connection out of the DbHandler's pools
+and reports back through Qt signals, which are delivered on the GUI thread.
+"""
+
+import logging
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class TaskSignals(QObject):
+    result = pyqtSignal(object)
+    chunk = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class DbTask(QRunnable):
+    """Run `fn(conn)` on a pool thread with a connection from the `purpose` pool."""
+
+    def __init__(self, db_handler, fn, purpose="ui"):
+        super().__init__()
+        self.db_handler = db_handler
+        self.fn = fn
+        self.purpose = purpose
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self):
+        conn = None
+        try:
+            conn = self.db_handler.acquire(self.purpose)
+            result = self.fn(conn)
+            conn.commit()
+            if not self.cancelled:
+                self.signals.result.emit(result)
+        except Exception as e:
+            logger.error("Async DB task failed: %s", e)
+            if conn is not None and not conn.closed:
+                conn.rollback()
+            if not self.cancelled:
+                self.signals.error.emit(str(e))
+        finally:
+            if conn is not None:
+                self.db_handler.release(conn, self.purpose)
+            self.signals.finished.emit()
+
+
+class StreamTask(DbTask):
+    """Stream a SELECT through a named cursor, emitting `chunk` per fetchmany()."""
+
+    def __init__(self, db_handler, sql, params, chunk_size, first_chunk=None):
+        super().__init__(db_handler, self._stream)
+        self.sql = sql
+        self.params = params
+        self.chunk_size = chunk_size
+        self.first_chunk = first_chunk or chunk_size
+
+    def _stream(self, conn):
+        loaded = 0
+        with conn.cursor(name="portal_stream") as cur:
+            cur.itersize = self.chunk_size
+            cur.execute(self.sql, self.params)
+            size = self.first_chunk
+            while not self.cancelled:
+                rows = cur.fetchmany(size)
+                if rows:
+                    loaded += len(rows)
+                    self.signals.chunk.emit(rows)
+                if len(rows) < size:
+                    break
+                size = self.chunk_size
+        return loaded
+
+
+class AsyncDbExecutor(QObject):
+    """Schedules DbTasks: reads run in parallel, writes run one at a time in order."""
+
+    READ_THREADS = 2
+
+    def __init__(self, db_handler, parent=None):
+        super().__init__(parent)
+        self.db_handler = db_handler
+        self.read_pool = QThreadPool(self)
+        self.read_pool.setMaxThreadCount(self.READ_THREADS)
+        self.write_pool = QThreadPool(self)
+        self.write_pool.setMaxThreadCount(1)
+        self._tasks = set()  # keep tasks (and their signals) alive until finished
+
+    def run(self, fn, on_result=None, on_error=None, write=False):
+        """Run `fn(conn)` in the background; returns the task."""
+        task = DbTask(self.db_handler, fn, "write" if write else "ui")
+        return self._start(task, on_result, on_error, write)
+
+    def stream(self, sql, params, chunk_size, on_chunk, on_done=None, on_error=None, first_chunk=None):
+        """Stream `sql` in chunks to `on_chunk(rows)`; returns the task (cancellable)."""
+        task = StreamTask(self.db_handler, sql, params, chunk_size, first_chunk)
+        task.signals.chunk.connect(on_chunk)
+        return self._start(task, on_done, on_error, write=False)
+
+    def _start(self, task, on_result, on_error, write):
+        if on_result is not None:
+            task.signals.result.connect(on_result)
+        if on_error is not None:
+            task.signals.error.connect(on_error)
+        self._tasks.add(task)
+        task.signals.finished.connect(lambda: self._tasks.discard(task))
+        (self.write_pool if write else self.read_pool).start(task)
+        return task
+
+    def cancel_all(self):
+        for task in list(self._tasks):
+            task.cancel()
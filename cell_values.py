@@ -0,0 +1,73 @@
+"""
+cell_values.py
+
+Native cell values of the portal table: conversion of edited text to the
+column type, display text, and the multi-column row ordering used by
+PortalTableModel. Kept free of Qt so it can be used (and tested) anywhere.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+INTEGER_TYPES = ("integer", "smallint", "bigint")
+NUMERIC_TYPES = ("integer", "smallint", "bigint", "numeric", "real", "double precision")
+DATE_TYPES = ("date", "timestamp without time zone", "timestamp with time zone")
+
+
+def to_text(value):
+    """Display text for a native cell value (only used at render/copy time)."""
+    return "" if value is None else str(value)
+
+
+def coerce_value(value, dtype):
+    """
+    Convert edited text to the native type of a column, as psycopg2 would
+    return it. Empty text is NULL; invalid input raises ValueError.
+    """
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text == "":
+        return None
+    if dtype in INTEGER_TYPES:
+        return int(text)
+    if dtype == "numeric":
+        try:
+            return Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"invalid numeric value: {text!r}")
+    if dtype in ("real", "double precision"):
+        return float(text)
+    if dtype == "date":
+        return date.fromisoformat(text[:10])
+    if dtype in DATE_TYPES:
+        return datetime.fromisoformat(text)
+    if dtype == "boolean":
+        lowered = text.lower()
+        if lowered in ("true", "t", "yes", "1"):
+            return True
+        if lowered in ("false", "f", "no", "0"):
+            return False
+        raise ValueError(f"invalid boolean value: {text!r}")
+    return value
+
+
+def sorted_rows(order, data, sort_keys):
+    """
+    Stable multi-column sort of the storage rows in `order` (a new list).
+    `data` holds one list of native values per column; `sort_keys` is
+    [(col, descending), ...] with the most significant first. Empty/NULL
+    cells always go last.
+    """
+    # Least significant key first; each pass is stable, so earlier keys break ties
+    for column, descending in reversed(sort_keys):
+        keys = data[column]
+        nulls = [rid for rid in order if keys[rid] is None or keys[rid] == ""]
+        values = [rid for rid in order if not (keys[rid] is None or keys[rid] == "")]
+        try:
+            values.sort(key=keys.__getitem__, reverse=descending)
+        except TypeError:
+            # Mixed types in one column: fall back to comparing the text
+            values.sort(key=lambda rid: to_text(keys[rid]), reverse=descending)
+        order = values + nulls
+    return list(order)
@@ -1,12 +1,13 @@
 from qgis.PyQt.QtWidgets import QMessageBox
 import psycopg2
-import select
-import threading
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject
-from .db_handler import signal_bus
+import logging
+from PyQt5.QtCore import QSocketNotifier, QTimer, pyqtSignal, QObject
+from .db_handler import signal_bus, get_shared_db_handler
 
-# Import EDITABLE_FIELDS from login dialog or config
-from .login_dialog import EDITABLE_FIELDS
+# is_field_editable lives in permissions (no Qt imports); re-exported here for callers
+from .permissions import is_field_editable  # noqa: F401
+
+logger = logging.getLogger(__name__)
 
 # Function to show a GUI warning in QGIS
 def show_conflict_warning(user_editing, row_id, column):
@@ -24,141 +25,179 @@ def show_privilege_error(column):
     msg.setWindowTitle("Permission Denied")
     msg.exec_()
 
-# Function to check if a field is editable by the user role
-def is_field_editable(role, field_name, row_data=None, user_emp_id=None, project=None, table_name=None):
-    # Use table_name for lookup
-    editable_fields = []
-    if table_name:
-        editable_fields = EDITABLE_FIELDS.get(table_name, {}).get(role, [])
-    else:
-        editable_fields = EDITABLE_FIELDS.get(role, [])
-
-
-    if field_name not in editable_fields:
-        return False
-
-    # Grand leaders: no row-wise restriction
-    if role == "grand_leaders":
-        return True
-
-    # Row-wise restriction maps
-    rfdb_leader_col_map = {
-        'rfdb_production_leaders': 'rfdb_production_team_leader_emp_id',
-        'siloc_production_leaders': 'siloc_production_team_leader_emp_id',
-        'siloc_qc_leaders': 'siloc_qc_team_leader_emp_id',
-        'rfdb_qc_leaders': 'rfdb_qc_team_leader_emp_id',
-        'rfdb_attri_qc_leaders': 'rfdb_attri_qc_team_leader_emp_id',
-        'rfdb_path_association_qc_leaders': 'rfdb_path_association_qc_team_leader_emp_id'
-    }
-    tm_leader_col_map = {
-        'rfdb_production_leaders': 'rfdb_production_team_leader_emp_id',
-        'rfdb_qc_leaders': 'rfdb_qc_team_leader_emp_id',
-        'rfdb_production_users': 'rfdb_production_emp_id',
-        'rfdb_qc_users': 'rfdb_qc_emp_id',
-        'siloc_qc_leaders': 'siloc_team_leader_emp_id',
-        'siloc_production_leaders': 'siloc_team_leader_emp_id',
-        'siloc_production_users': 'siloc_emp_id',
-        'siloc_qc_users': 'siloc_emp_id'
-    }
-
-    # Select the correct map based on project
-    leader_col = None
-    if project == "turn_maneuver_project":
-        leader_col = tm_leader_col_map.get(role)
-    else:
-        leader_col = rfdb_leader_col_map.get(role)
-
-    if leader_col and row_data and user_emp_id is not None:
-        leader_emp_id = row_data.get(leader_col)
-        return str(leader_emp_id) == str(user_emp_id)
-    return True  # If no row restriction, allow
-
-class PostgresListener(QObject):
-    notified = pyqtSignal(str)  # You can pass payload if needed
-
-    def __init__(self, dsn, channel):
-        super().__init__()
-        self.conn = psycopg2.connect(dsn)
-        self.conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
-        self.cur = self.conn.cursor()
-        self.cur.execute(f"LISTEN {channel};")
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.check_notify)
-        self.timer.start(1000)  # Check every second
+class _ChannelSignal(QObject):
+    notified = pyqtSignal(str)  # payload
 
-    def close(self):
-        try:
-            self.timer.stop()
-            self.cur.close()
-            self.conn.close()
-            print("✅ Listener connection closed")
-        except Exception as e:
-            print(f"Error closing listener: {e}")
 
+class NotificationHub(QObject):
+    """
+    The session's single LISTEN connection. Components subscribe(channel, slot)
+    instead of opening their own listener; the hub LISTENs on a channel the
+    first time it is subscribed and fans each payload out to slot(payload)
+    on the GUI thread. A QSocketNotifier watches the connection's socket, so
+    the GUI thread is only woken when the server sends something. A lost
+    connection is re-opened (re-LISTENing every channel) and `reconnected`
+    is emitted so subscribers can catch up on what they missed.
+    Closed on signal_bus.logout_signal.
+    """
+    channel_notified = pyqtSignal(str, str)  # (channel, payload) for every channel
+    reconnected = pyqtSignal()
+
+    RECONNECT_DELAY_MS = 5000
 
-    def check_notify(self):
-        self.conn.poll()
+    def __init__(self, db_handler):
+        super().__init__()
+        self.db_handler = db_handler
+        self.conn = None
+        self.notifier = None
+        self._channels = {}  # channel -> _ChannelSignal
+        self._closed = False
+        signal_bus.logout_signal.connect(self.close)
+
+    @classmethod
+    def for_handler(cls, db_handler):
+        """The hub shared by everything using this DbHandler (one per login session)."""
+        hub = getattr(db_handler, "notification_hub", None)
+        if hub is None:
+            hub = cls(db_handler)
+            db_handler.notification_hub = hub
+        return hub
+
+    def _connect(self):
+        """Open the listener connection and LISTEN on every subscribed channel."""
+        self.conn = self.db_handler.acquire("listener")
+        try:
+            self.conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with self.conn.cursor() as cur:
+                for channel in self._channels:
+                    cur.execute(f"LISTEN {channel};")
+        except psycopg2.Error:
+            self._drop_connection()
+            raise
+        self.notifier = QSocketNotifier(self.conn.fileno(), QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self.check_notify)
+
+    def _drop_connection(self):
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier.deleteLater()
+            self.notifier = None
+        if self.conn is not None:
+            try:
+                self.db_handler.release(self.conn, "listener")
+            except Exception as e:
+                logger.warning("Error returning the listener connection: %s", e)
+            self.conn = None
+
+    def _schedule_reconnect(self):
+        if not self._closed:
+            QTimer.singleShot(self.RECONNECT_DELAY_MS, self._reconnect)
+
+    def _reconnect(self):
+        if self._closed or self.conn is not None:
+            return
+        try:
+            self._connect()
+        except Exception as e:
+            logger.error("Notification hub reconnect failed, retrying in %d ms: %s", self.RECONNECT_DELAY_MS, e)
+            self._schedule_reconnect()
+            return
+        logger.info("Notification hub reconnected (%d channels)", len(self._channels))
+        self.reconnected.emit()
+
+    def subscribe(self, channel, slot):
+        """Deliver every NOTIFY on `channel` to slot(payload)."""
+        if channel not in self._channels:
+            self._channels[channel] = _ChannelSignal(self)
+            try:
+                if self.conn is None:
+                    self._connect()  # LISTENs on every channel, this one included
+                else:
+                    with self.conn.cursor() as cur:
+                        cur.execute(f"LISTEN {channel};")
+                logger.info("Notification hub listening on '%s'", channel)
+            except Exception as e:
+                # Picked up by the next (re)connect
+                logger.error("Notification hub could not LISTEN on '%s': %s", channel, e)
+                self._drop_connection()
+                self._schedule_reconnect()
+        self._channels[channel].notified.connect(slot)
+
+    def unsubscribe(self, channel, slot):
+        channel_signal = self._channels.get(channel)
+        if channel_signal is None:
+            return
+        try:
+            channel_signal.notified.disconnect(slot)
+        except TypeError:
+            pass  # was not connected
+
+    def check_notify(self, *args):
+        """Drain every pending notification and dispatch it to the channel's subscribers."""
+        if self.conn is None:
+            return
+        try:
+            self.conn.poll()
+        except psycopg2.Error as e:
+            # Stop watching the dead socket and open a fresh connection
+            logger.error("Notification hub connection lost: %s", e)
+            self._drop_connection()
+            self._schedule_reconnect()
+            return
         while self.conn.notifies:
             notify = self.conn.notifies.pop(0)
-            self.notified.emit(notify.payload)
+            channel_signal = self._channels.get(notify.channel)
+            if channel_signal is not None:
+                channel_signal.notified.emit(notify.payload)
+            self.channel_notified.emit(notify.channel, notify.payload)
 
-# Improved: Listen for database edit conflicts in a thread-safe way
-def listen_for_edits(current_user_role, db_config, db_user, db_password):
+    def close(self):
+        self._closed = True
+        try:
+            signal_bus.logout_signal.disconnect(self.close)
+        except TypeError:
+            pass
+        if getattr(self.db_handler, "notification_hub", None) is self:
+            self.db_handler.notification_hub = None
+        self._channels = {}
+        if self.conn is not None:
+            self._drop_connection()
+            print("✅ Notification hub connection closed")
+
+
+# Listen for database edit conflicts through the session's NotificationHub
+def listen_for_edits(current_user_role, db_config):
     """
-    Start a background thread to listen for edit conflicts.
-    This version can be cleanly shut down via logout signal.
+    Show conflict / privilege warnings for NOTIFY edit_conflict payloads
+    ("row_id,column,user_editing,current_user"). Uses the shared DbHandler's
+    NotificationHub, so no extra connection or thread is opened; the
+    subscription ends with the hub on logout. Returns the slot (for unsubscribe).
     """
-    stop_event = threading.Event()
-    signal_bus.logout_signal.connect(stop_event.set)
-
-    def _listen():
-        conn = None
-        cursor = None
-        try:
-            conn = psycopg2.connect(
-                dbname=db_config["dbname"],
-                user=db_user,
-                password=db_password,
-                host=db_config["host"],
-                port=db_config["port"]
-            )
-            conn.autocommit = True
-            cursor = conn.cursor()
-            cursor.execute("LISTEN edit_conflict;")
-            print("🔍 Listening for conflicts in QGIS...")
-
-            while not stop_event.is_set():
-                if select.select([conn], [], [], 5) == ([conn], [], []):
-                    conn.poll()
-                    while conn.notifies:
-                        notify = conn.notifies.pop(0)
-                        cell_data = notify.payload.split(",")
-                        if len(cell_data) == 4:
-                            row_id, column, user_editing, current_user = cell_data
-                            if is_field_editable(
-                                current_user_role,
-                                column,
-                                table_name=db_config.get("table_name"),
-                                project=db_config.get("project")
-                            ):
-                                print(f"⚠️ Conflict detected: User {user_editing} is editing ({row_id}, {column}).")
-                                show_conflict_warning(user_editing, row_id, column)
-                            else:
-                                print(f"❌ No privilege to edit column: {column}")
-                                show_privilege_error(column)
-                        else:
-                            print("⚠️ Received malformed notification:", notify.payload)
-
-        except psycopg2.Error as e:
-            print(f"❌ Database error: {e}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
-                print("✅ Conflict listener DB connection closed.")
-
-    thread = threading.Thread(target=_listen, daemon=True)
-    thread.start()
+    db_handler = get_shared_db_handler()
+    if db_handler is None:
+        print("❌ Cannot listen for edit conflicts: not logged in")
+        return None
+
+    def _on_edit_conflict(payload):
+        cell_data = payload.split(",")
+        if len(cell_data) != 4:
+            print("⚠️ Received malformed notification:", payload)
+            return
+        row_id, column, user_editing, current_user = cell_data
+        if is_field_editable(
+            current_user_role,
+            column,
+            table_name=db_config.get("table_name"),
+            project=db_config.get("project")
+        ):
+            print(f"⚠️ Conflict detected: User {user_editing} is editing ({row_id}, {column}).")
+            show_conflict_warning(user_editing, row_id, column)
+        else:
+            print(f"❌ No privilege to edit column: {column}")
+            show_privilege_error(column)
+
+    NotificationHub.for_handler(db_handler).subscribe("edit_conflict", _on_edit_conflict)
+    print("🔍 Listening for conflicts in QGIS...")
+    return _on_edit_conflict
 
 
@@ -194,4 +194,38 @@ DATE_COLUMNS = [
     "wu_received_date", "rfdb_allotted_date", "rfdb_completed_date",
     "rfdb_qc_allotted_date", "rfdb_qc_completed_date", "siloc_allotted_date",
     "siloc_completed_date", "delivery_date"
-]
\ No newline at end of file
+]
+
+# Row-wise restriction: the column holding the employee a role's rows belong to
+RFDB_LEADER_COLUMNS = {
+    'rfdb_production_leaders': 'rfdb_production_team_leader_emp_id',
+    'siloc_production_leaders': 'siloc_production_team_leader_emp_id',
+    'siloc_qc_leaders': 'siloc_qc_team_leader_emp_id',
+    'rfdb_qc_leaders': 'rfdb_qc_team_leader_emp_id',
+    'rfdb_attri_qc_leaders': 'rfdb_attri_qc_team_leader_emp_id',
+    'rfdb_path_association_qc_leaders': 'rfdb_path_association_qc_team_leader_emp_id'
+}
+
+TM_LEADER_COLUMNS = {
+    'rfdb_production_leaders': 'rfdb_production_team_leader_emp_id',
+    'rfdb_qc_leaders': 'rfdb_qc_team_leader_emp_id',
+    'rfdb_production_users': 'rfdb_production_emp_id',
+    'rfdb_qc_users': 'rfdb_qc_emp_id',
+    'siloc_qc_leaders': 'siloc_team_leader_emp_id',
+    'siloc_production_leaders': 'siloc_team_leader_emp_id',
+    'siloc_production_users': 'siloc_emp_id',
+    'siloc_qc_users': 'siloc_emp_id'
+}
+
+# emp_id columns and the name column auto-filled from the employee directory
+EMP_ID_TO_NAME_FIELD = {
+    "rfdb_production_emp_id": "rfdb_production_done_by",
+    "siloc_production_emp_id": "siloc_production_done_by",
+    "siloc_qc_emp_id": "siloc_qc_done_by",
+    "rfdb_path_association_production_emp_id": "rfdb_path_association_production_done_by",
+    "rfdb_qc_emp_id": "rfdb_qc_done_by",
+    "rfdb_attri_qc_emp_id": "rfdb_attri_qc_done_by",
+    "rfdb_roadtype_qc_emp_id": "rfdb_roadtype_qc_done_by",
+    "rfdb_qa_emp_id": "rfdb_qa_done_by",
+    "rfdb_path_association_qc_emp_id": "rfdb_path_association_qc_done_by"
+}
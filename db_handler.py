@@ -1,5 +1,9 @@
 import psycopg2
+import psycopg2.pool
 import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -26,6 +30,103 @@ def get_shared_db_handler():
     return _db_handler_instance
 
 
+# --- Schema Metadata Cache ---
+# Shared by every DbHandler in the session, keyed by (dbname, schema, table).
+# Entries expire after SCHEMA_CACHE_TTL seconds or when a schema change is
+# announced with: NOTIFY schema_changed, '<schema>.<table>'  (empty payload = all)
+SCHEMA_CACHE_TTL = 3600
+SCHEMA_CHANGE_CHANNEL = "schema_changed"
+
+_schema_cache = {}
+_schema_cache_lock = threading.Lock()
+
+
+# --- Database-side change notifications ---
+# sql/change_notify_triggers.sql installs statement-level triggers that NOTIFY
+# '<table>_update' for every INSERT/UPDATE/DELETE, whoever makes it.
+CHANGE_TRIGGERS_SQL = os.path.join(os.path.dirname(__file__), "sql", "change_notify_triggers.sql")
+CHANGE_TRIGGER_NAME = "wap_notify_update"
+
+
+class TableSchema:
+    """Column metadata for one table, in ordinal order."""
+
+    def __init__(self, columns, types, nullable, primary_key, casts=None):
+        self.columns = columns          # [column_name, ...]
+        self.types = types              # {column_name: data_type}
+        self.nullable = nullable        # {column_name: bool}
+        self.primary_key = primary_key  # [column_name, ...]
+        self.casts = casts or {}        # {column_name: type usable in ::cast (enums/PostGIS too)}
+        self.loaded_at = time.monotonic()
+
+    def is_expired(self, ttl=SCHEMA_CACHE_TTL):
+        return time.monotonic() - self.loaded_at > ttl
+
+
+def query_table_schema(conn, schema, table):
+    """Read column names, types, nullability and the primary key of schema.table."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT column_name, data_type, is_nullable = 'YES', udt_schema, udt_name
+            FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s
+            ORDER BY ordinal_position
+        """, (schema, table))
+        rows = cur.fetchall()
+        cur.execute("""
+            SELECT kcu.column_name
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+              ON kcu.constraint_name = tc.constraint_name
+             AND kcu.table_schema = tc.table_schema
+             AND kcu.table_name = tc.table_name
+            WHERE tc.constraint_type = 'PRIMARY KEY'
+              AND tc.table_schema = %s AND tc.table_name = %s
+            ORDER BY kcu.ordinal_position
+        """, (schema, table))
+        primary_key = [row[0] for row in cur.fetchall()]
+    return TableSchema(
+        [row[0] for row in rows],
+        {name: dtype for name, dtype, *_ in rows},
+        {name: nullable for name, _, nullable, *_ in rows},
+        primary_key,
+        {name: column_cast(dtype, udt_schema, udt_name) for name, dtype, _, udt_schema, udt_name in rows}
+    )
+
+
+def column_cast(data_type, udt_schema, udt_name):
+    """SQL type for casting text to a column; USER-DEFINED and ARRAY types use the udt name."""
+    if data_type == "USER-DEFINED":
+        return f'"{udt_schema}"."{udt_name}"'
+    if data_type == "ARRAY":
+        return f'"{udt_schema}"."{udt_name.lstrip("_")}"[]'
+    return data_type
+
+
+def invalidate_schema_cache(dbname=None, schema=None, table=None):
+    """Drop cached schemas; any argument left as None matches every entry."""
+    with _schema_cache_lock:
+        for key in list(_schema_cache):
+            if (dbname in (None, key[0]) and schema in (None, key[1])
+                    and table in (None, key[2])):
+                del _schema_cache[key]
+
+
+# --- Connection Pools ---
+# Bounded pools per purpose, so a burst of background lookups cannot starve
+# the table UI and writes never wait behind a long read. (minconn, maxconn)
+POOL_LIMITS = {
+    "ui": (1, 4),          # table loads, notify refetches, value pools
+    "write": (1, 2),       # cell and batch updates
+    "listener": (0, 2),    # long-lived LISTEN connections
+    "background": (0, 3),  # employee-name lookups and similar
+}
+# Pooled connections idle for longer than this are pinged before reuse
+HEALTH_CHECK_IDLE = 60
+# Seconds a checkout waits for a free connection before giving up
+POOL_WAIT_TIMEOUT = 30
+
+
 # --- Custom Exceptions ---
 class NotConnectedException(Exception):
     pass
@@ -47,6 +148,12 @@ class DbHandler:
         self.conn = None
         self.is_cleaned_up = False
         self.selected_table = None
+        self._pools = {}  # purpose -> ThreadedConnectionPool, created on first use
+        self._slots = {}  # purpose -> semaphore, so checkouts wait instead of raising PoolError
+        self._pools_lock = threading.Lock()
+        self._last_used = {}  # id(conn) -> time it was returned to its pool
+        self._pooled_conns = {}  # id(conn) -> conn, every connection our pools handed out
+        self._change_triggers = {}  # (schema, table) -> bool, checked once per session
 
     def connect(self):
         if self.is_cleaned_up:
@@ -87,6 +194,143 @@ class DbHandler:
             self.conn.close()
             self.conn = None
             logger.info("DB connection closed.")
+        self.close_pools()
+
+    # --- Pooled connections ---
+    def _pool(self, purpose):
+        """
+        (pool, slots) for `purpose`, created lazily (i.e. only after the login
+        session check). Looked up under the lock so close_pools() cannot race it.
+        """
+        if self.is_cleaned_up:
+            raise NotConnectedException("Connection cleaned up.")
+        with self._pools_lock:
+            pool = self._pools.get(purpose)
+            if pool is None:
+                minconn, maxconn = POOL_LIMITS[purpose]
+                kwargs = {}
+                if getattr(self, "emp_id", None):
+                    # Same session variable connect() sets via set_session_emp_id()
+                    kwargs["options"] = f"-c app.current_user_emp_id={self.username}"
+                pool = psycopg2.pool.ThreadedConnectionPool(
+                    minconn, maxconn, self.get_dsn(),
+                    application_name=f"work_allocation_portal:{purpose}", **kwargs
+                )
+                # Check the pre-opened connections out once so they are tracked too
+                warm = [pool.getconn() for _ in range(minconn)]
+                for conn in warm:
+                    self._pooled_conns[id(conn)] = conn
+                    pool.putconn(conn)
+                self._pools[purpose] = pool
+                self._slots[purpose] = threading.BoundedSemaphore(maxconn)
+                logger.info("Created '%s' connection pool (%d-%d)", purpose, minconn, maxconn)
+            return pool, self._slots[purpose]
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        if time.monotonic() - self._last_used.get(id(conn), 0) < HEALTH_CHECK_IDLE:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def acquire(self, purpose="ui"):
+        """Check a healthy connection out of the `purpose` pool; pair with release()."""
+        pool, slots = self._pool(purpose)
+        if not slots.acquire(timeout=POOL_WAIT_TIMEOUT):
+            raise psycopg2.pool.PoolError(f"No free '{purpose}' connection after {POOL_WAIT_TIMEOUT}s")
+        try:
+            for _ in range(2):
+                conn = pool.getconn()
+                if self._is_healthy(conn):
+                    break
+                logger.warning("Discarding broken pooled connection (%s)", purpose)
+                with self._pools_lock:
+                    self._pooled_conns.pop(id(conn), None)
+                pool.putconn(conn, close=True)
+            else:
+                conn = pool.getconn()
+        except Exception:
+            # Includes PoolError when close_pools() closed the pool meanwhile
+            slots.release()
+            raise
+        with self._pools_lock:
+            self._pooled_conns[id(conn)] = conn
+        return conn
+
+    def release(self, conn, purpose="ui"):
+        """Return a connection to its pool in a clean state."""
+        with self._pools_lock:
+            pool = self._pools.get(purpose)
+            slots = self._slots.get(purpose)
+        if pool is None or pool.closed:
+            if not conn.closed:
+                conn.close()
+            return
+        try:
+            if conn.closed:
+                pool.putconn(conn, close=True)
+                return
+            try:
+                if conn.autocommit:
+                    if purpose == "listener":
+                        with conn.cursor() as cur:
+                            cur.execute("UNLISTEN *")
+                    conn.autocommit = False
+                else:
+                    conn.rollback()
+            except psycopg2.Error:
+                pool.putconn(conn, close=True)
+                return
+            self._last_used[id(conn)] = time.monotonic()
+            pool.putconn(conn)
+        finally:
+            slots.release()
+
+    @contextmanager
+    def pooled_connection(self, purpose="ui"):
+        """`with db.pooled_connection("write") as conn:` -- checkout/return around a block."""
+        conn = self.acquire(purpose)
+        try:
+            yield conn
+        finally:
+            self.release(conn, purpose)
+
+    def own_backend_pids(self):
+        """Backend PIDs of this handler's own connections (pooled and shared)."""
+        pids = set()
+        if self.conn is not None and not self.conn.closed:
+            pids.add(self.conn.get_backend_pid())
+        with self._pools_lock:
+            # Connections the pools closed (overflow above minconn, broken) are dropped here
+            for key, conn in list(self._pooled_conns.items()):
+                if conn.closed:
+                    del self._pooled_conns[key]
+            conns = list(self._pooled_conns.values())
+        for conn in conns:
+            try:
+                pids.add(conn.get_backend_pid())
+            except psycopg2.Error:
+                pass  # closed meanwhile
+        return pids
+
+    def close_pools(self):
+        with self._pools_lock:
+            pools, self._pools = self._pools, {}
+            self._slots = {}
+            self._pooled_conns = {}
+        for purpose, pool in pools.items():
+            try:
+                pool.closeall()
+                logger.info("Closed '%s' connection pool.", purpose)
+            except psycopg2.pool.PoolError:
+                pass
+        self._last_used.clear()
 
     def cleanup(self):
         self.is_cleaned_up = True
@@ -98,11 +342,15 @@ class DbHandler:
             return cur.fetchone()[0]
 
     def get_active_sessions(self, exclude_pid=None):
+        # Pooled connections belong to this session, never count them as "other" sessions
+        own_pids = self.own_backend_pids()
+        if exclude_pid:
+            own_pids.add(exclude_pid)
         with self.get_cursor_with_retries() as cur:
-            if exclude_pid:
+            if own_pids:
                 cur.execute(
-                    "SELECT pid FROM pg_stat_activity WHERE usename = %s AND pid != %s",
-                    (self.username, exclude_pid)
+                    "SELECT pid FROM pg_stat_activity WHERE usename = %s AND pid <> ALL(%s)",
+                    (self.username, list(own_pids))
                 )
             else:
                 cur.execute(
@@ -187,6 +435,69 @@ class DbHandler:
             cur.execute(f'SELECT DISTINCT subcountry FROM {table_name}')
             return [row[0] for row in cur.fetchall() if row[0] is not None]
 
+    def cached_table_schema(self, schema, table):
+        """Return the cached TableSchema for schema.table, or None if absent/expired."""
+        with _schema_cache_lock:
+            entry = _schema_cache.get((self.config['dbname'], schema, table))
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    def get_table_schema(self, schema, table, conn=None):
+        """
+        Return the TableSchema for schema.table, querying information_schema only
+        on a cache miss. Pass `conn` when calling from a worker thread.
+        """
+        entry = self.cached_table_schema(schema, table)
+        if entry is not None:
+            return entry
+        entry = query_table_schema(conn or self.connect(), schema, table)
+        with _schema_cache_lock:
+            _schema_cache[(self.config['dbname'], schema, table)] = entry
+        logger.info("Cached schema for %s.%s (%d columns)", schema, table, len(entry.columns))
+        return entry
+
+    def handle_schema_change(self, payload):
+        """NOTIFY schema_changed handler: payload is 'schema.table' or empty for all."""
+        payload = (payload or "").replace('"', '').strip()
+        if not payload:
+            invalidate_schema_cache(self.config['dbname'])
+            return
+        schema, _, table = payload.rpartition('.')
+        invalidate_schema_cache(self.config['dbname'], schema or None, table)
+        logger.info("Schema cache invalidated for %s", payload)
+
+    def has_change_triggers(self, schema, table, conn=None):
+        """
+        True if the database publishes changes to schema.table itself
+        (CHANGE_TRIGGER_NAME is installed and enabled). Cached per session.
+        """
+        key = (schema, table)
+        if key not in self._change_triggers:
+            with (conn or self.connect()).cursor() as cur:
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_trigger "
+                    "WHERE tgrelid = to_regclass(%s) AND tgname = %s AND tgenabled <> 'D')",
+                    (f'"{schema}"."{table}"', CHANGE_TRIGGER_NAME)
+                )
+                self._change_triggers[key] = cur.fetchone()[0]
+        return self._change_triggers[key]
+
+    def install_change_triggers(self):
+        """Run sql/change_notify_triggers.sql; needs owner rights on the portal tables."""
+        with open(CHANGE_TRIGGERS_SQL, encoding="utf-8") as f:
+            sql = f.read()
+        with self.pooled_connection("background") as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
+                conn.commit()
+            except psycopg2.Error:
+                conn.rollback()
+                raise
+        self._change_triggers = {}
+        logger.info("Installed change notification triggers")
+
     def get_dsn(self):
         return (
             f"dbname={self.config['dbname']} "
@@ -0,0 +1,86 @@
+"""
+employee_directory.py
+
+In-memory employee_id -> employee_name map used to auto-fill the "done_by"
+name columns (EMP_ID_TO_NAME_FIELD). Loaded once at login with a single
+query, refreshed after EMPLOYEE_DIRECTORY_TTL seconds or when
+'NOTIFY employee_changed' is received.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+EMPLOYEE_DIRECTORY_TTL = 1800
+EMPLOYEE_MISS_RELOAD_INTERVAL = 60  # seconds between reloads triggered by unknown ids
+EMPLOYEE_CHANGE_CHANNEL = "employee_changed"
+
+
+class EmployeeDirectory:
+    def __init__(self, db_handler):
+        self.db_handler = db_handler
+        self._names = {}
+        self._loaded_at = None
+        self._reloading = threading.Lock()
+
+    @classmethod
+    def for_handler(cls, db_handler):
+        """The directory shared by everything using this DbHandler."""
+        directory = getattr(db_handler, "employee_directory", None)
+        if directory is None:
+            directory = cls(db_handler)
+            db_handler.employee_directory = directory
+        return directory
+
+    def load(self):
+        """(Re)load the whole directory with one query; safe to call from any thread."""
+        if not self._reloading.acquire(blocking=False):
+            return  # a reload is already running
+        try:
+            with self.db_handler.pooled_connection("background") as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT employee_id, employee_name FROM public.employee")
+                    names = {str(emp_id).strip(): name for emp_id, name in cur.fetchall()}
+            self._names = names  # swapped in one assignment; readers never see a partial map
+            self._loaded_at = time.monotonic()
+            logger.info("Employee directory loaded (%d employees)", len(names))
+        except Exception as e:
+            logger.error("Failed to load employee directory: %s", e)
+        finally:
+            self._reloading.release()
+
+    def reload_async(self):
+        if not self._reloading.locked():
+            threading.Thread(target=self.load, daemon=True).start()
+
+    def is_expired(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > EMPLOYEE_DIRECTORY_TTL
+
+    def name_for(self, emp_id):
+        """Employee name for emp_id, or None. Never blocks on the database."""
+        if self.is_expired():
+            self.reload_async()  # serve the current map meanwhile
+        if emp_id is None:
+            return None
+        return self._names.get(str(emp_id).strip())
+
+    def names_for(self, emp_ids):
+        """
+        {emp_id: name} for many ids at once, from the in-memory map only (this
+        runs on the GUI thread). Unknown ids queue a background reload, throttled
+        to one per EMPLOYEE_MISS_RELOAD_INTERVAL, so a later fill can find them.
+        """
+        names = {}
+        missing = False
+        for emp_id in emp_ids:
+            employee_name = self.name_for(emp_id)
+            if employee_name:
+                names[emp_id] = employee_name
+            elif emp_id is not None:
+                missing = True
+        if missing and (self._loaded_at is None
+                        or time.monotonic() - self._loaded_at > EMPLOYEE_MISS_RELOAD_INTERVAL):
+            self.reload_async()
+        return names
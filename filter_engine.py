@@ -0,0 +1,144 @@
+"""
+filter_engine.py
+
+Bitset indexes for FilterManager. Rows are identified by their storage row
+in PortalTableModel (stable across sorting), and a set of rows is a Python
+int with bit `rid` set. Each column's value -> rows postings are built the
+first time that column is filtered and kept up to date on cell edits.
+"""
+
+
+def bitset(rids, size):
+    """Python int with the bits of `rids` set (built through a bytearray)."""
+    buf = bytearray((size + 7) // 8)
+    for rid in rids:
+        buf[rid >> 3] |= 1 << (rid & 7)
+    return int.from_bytes(buf, "little")
+
+
+def popcount(bits):
+    return bin(bits).count("1")
+
+
+def iter_bits(bits):
+    """Positions of the set bits of `bits`, in ascending order."""
+    return [i for i, c in enumerate(reversed(bin(bits)[2:])) if c == "1"] if bits else []
+
+
+class ColumnIndex:
+    """Lazily built value -> row-bitset postings (and value -> count) per column."""
+
+    def __init__(self, data, to_text=str):
+        self._data = data  # the model's columnar storage (list of lists)
+        self._to_text = to_text  # postings are keyed by display text
+        self._postings = {}  # col -> {value: bitset}
+        self._counts = {}  # col -> {value: number of rows}
+
+    @property
+    def size(self):
+        return len(self._data[0]) if self._data else 0
+
+    @property
+    def all_rows(self):
+        return (1 << self.size) - 1
+
+    def reset(self, data=None):
+        if data is not None:
+            self._data = data
+        self._postings = {}
+        self._counts = {}
+
+    def postings(self, col):
+        """{value: bitset} for a column, built on first use."""
+        postings = self._postings.get(col)
+        if postings is None:
+            rids_by_value = {}
+            for rid, value in enumerate(self._data[col]):
+                rids_by_value.setdefault(self._to_text(value), []).append(rid)
+            size = self.size
+            postings = {value: bitset(rids, size) for value, rids in rids_by_value.items()}
+            self._postings[col] = postings
+            self._counts[col] = {value: len(rids) for value, rids in rids_by_value.items()}
+        return postings
+
+    def counts(self, col):
+        """{value: row count} for a column over all rows."""
+        self.postings(col)
+        return self._counts[col]
+
+    def cell_changed(self, rid, col, old, new):
+        """Move one row between postings (old/new are texts); unbuilt columns are left alone."""
+        postings = self._postings.get(col)
+        if postings is None or old == new:
+            return
+        bit = 1 << rid
+        counts = self._counts[col]
+        remaining = postings.get(old, 0) & ~bit
+        if remaining:
+            postings[old] = remaining
+            counts[old] -= 1
+        else:
+            postings.pop(old, None)
+            counts.pop(old, None)
+        postings[new] = postings.get(new, 0) | bit
+        counts[new] = counts.get(new, 0) + 1
+
+    def rows_appended(self, base, count):
+        """Add storage rows base..base+count-1 (already in the data) to the built columns."""
+        for col, postings in self._postings.items():
+            rids_by_value = {}
+            column = self._data[col]
+            for rid in range(base, base + count):
+                rids_by_value.setdefault(self._to_text(column[rid]), []).append(rid - base)
+            counts = self._counts[col]
+            for value, rids in rids_by_value.items():
+                postings[value] = postings.get(value, 0) | bitset(rids, count) << base
+                counts[value] = counts.get(value, 0) + len(rids)
+
+    def rows_removed(self, new_rid, data):
+        """
+        Renumber the built columns after storage rows were dropped and the rest
+        compacted; `new_rid` maps old row -> new row (-1 for removed rows).
+        """
+        self._data = data
+        size = self.size
+        for col, postings in self._postings.items():
+            counts = self._counts[col]
+            for value, bits in list(postings.items()):
+                rids = [new_rid[rid] for rid in iter_bits(bits) if new_rid[rid] >= 0]
+                if rids:
+                    postings[value] = bitset(rids, size)
+                    counts[value] = len(rids)
+                else:
+                    del postings[value]
+                    del counts[value]
+
+    def matching(self, filters, except_col=None):
+        """Rows passing every {col: allowed values} filter (bitset intersection)."""
+        result = self.all_rows
+        for col, allowed in filters.items():
+            if col == except_col or col < 0:
+                continue
+            postings = self.postings(col)
+            column_bits = 0
+            for value in allowed:
+                column_bits |= postings.get(value, 0)
+            result &= column_bits
+            if not result:
+                break
+        return result
+
+    def values_within(self, col, rows):
+        """Distinct values of `col` occurring in the `rows` bitset."""
+        return [value for value, bits in self.postings(col).items() if bits & rows]
+
+    def value_counts(self, col, rows=None):
+        """{value: count} of `col`, restricted to the `rows` bitset if given."""
+        if rows is None or rows == self.all_rows:
+            return dict(self.counts(col))
+        counts = {}
+        for value, bits in self.postings(col).items():
+            n = popcount(bits & rows)
+            if n:
+                counts[value] = n
+        return counts
@@ -0,0 +1,112 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from PyQt5 import QtWidgets
+
+
+class FilterValueListModel(QAbstractListModel):
+    """Checkable list of a column's distinct values for the filter dialog.
+
+    Check state is stored as a default plus a set of exceptions, so Select All,
+    Clear and the "everything checked" test do not depend on the list length.
+    """
+
+    def __init__(self, values, counts=None, checked=None, parent=None):
+        super().__init__(parent)
+        self._values = list(values)
+        self._counts = counts or {}
+        if checked is None:
+            self._default = True
+            self._exceptions = set()
+        else:
+            # Start from whichever representation is smaller
+            checked = set(checked) & set(self._values)
+            if len(checked) * 2 > len(self._values):
+                self._default = True
+                self._exceptions = set(self._values) - checked
+            else:
+                self._default = False
+                self._exceptions = checked
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._values)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._values[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{value} ({self._counts[value]})" if value in self._counts else value
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.is_checked(value) else Qt.Unchecked
+        if role == Qt.UserRole:
+            return value
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        self.set_checked([index.row()], value == Qt.Checked)
+        return True
+
+    # --- Check state ---
+    def is_checked(self, value):
+        return self._default != (value in self._exceptions)
+
+    def set_checked(self, rows, checked):
+        for row in rows:
+            value = self._values[row]
+            if checked == self._default:
+                self._exceptions.discard(value)
+            else:
+                self._exceptions.add(value)
+        for row in rows:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def set_all_checked(self, checked):
+        self._default = checked
+        self._exceptions = set()
+        if self._values:
+            self.dataChanged.emit(self.index(0), self.index(len(self._values) - 1), [Qt.CheckStateRole])
+
+    def all_checked(self):
+        return self._default and not self._exceptions
+
+    def checked_values(self):
+        if self._default:
+            return set(self._values) - self._exceptions
+        return set(self._exceptions)
+
+
+class FilterValueProxyModel(QSortFilterProxyModel):
+    """Case-insensitive substring search over the raw values (not the counts)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterRole(Qt.UserRole)
+
+
+class CheckableListView(QtWidgets.QListView):
+    """List view where Space toggles every selected row to the focused row's opposite state."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)  # lets the view lay out huge lists lazily
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Space:
+            proxy = self.model()
+            source = proxy.sourceModel()
+            current = self.currentIndex()
+            selected = self.selectionModel().selectedIndexes()
+            if current.isValid() and selected:
+                checked = current.data(Qt.CheckStateRole) != Qt.Checked
+                source.set_checked([proxy.mapToSource(i).row() for i in selected], checked)
+            return
+        super().keyPressEvent(event)
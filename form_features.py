@@ -7,23 +7,16 @@ class UndoRedoDelegate(QStyledItemDelegate):
         super().__init__(parent)
         self.prev_value_dict = prev_value_dict
 
-    def flags(self, index):
-        row = index.row()
-        col = index.column()
-        dialog = self.parent().parent()
-        if hasattr(dialog, "is_cell_editable") and dialog.is_cell_editable(row, col):
-            return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
-        else:
-            return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    # Editability comes from PortalTableModel.flags(), so no flags() override here.
 
     def createEditor(self, parent, option, index):
         row = index.row()
         col = index.column()
-        value = index.model().data(index)
+        model = index.model()
         dialog = self.parent().parent()
-        s_no_item = dialog.ui.tableWidget.item(row, dialog.columns.index("s_no"))
-        if s_no_item:
-            s_no = s_no_item.text()
+        value = model.value(row, col)
+        s_no = model.value(row, dialog.columns.index("s_no"))
+        if s_no:
             col_name = dialog.columns[col]
             self.prev_value_dict[(s_no, col_name)] = value
         #print(f"[DELEGATE PRE-EDIT] Cell ({row}, {col}) previous value: {value}")
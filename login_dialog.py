@@ -6,15 +6,15 @@ from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
 import pandas as pd
 import psycopg2
-from qgis.core import QgsVectorLayer, Qgis, QgsProject
+from qgis.core import QgsVectorLayer, Qgis, QgsProject, QgsFeatureRequest
 from qgis.utils import iface
-from .constants import EDITABLE_FIELDS
+from .constants import EDITABLE_FIELDS, EMP_ID_TO_NAME_FIELD
+from .employee_directory import EmployeeDirectory
 from .work_allocation_portal_dialog import WorkAllocationPortalViewerDialog
 from .db_handler import DbHandler
 from .conflict_listener import is_field_editable
 import logging
 import sip
-import threading
 import os
 from shapely import wkt
 from shapely.geometry import MultiLineString
@@ -44,6 +44,13 @@ class LoginDialog(QDialog):
         self._is_logging_out = False
         self.db_handler = None  # Set after login
 
+        # --- Batched emp_id -> name fill for the editable layer ---
+        self._pending_name_fills = {}  # fid -> set of emp_id fields
+        self._filling_names = False
+        self._name_fill_timer = QTimer(self)
+        self._name_fill_timer.setSingleShot(True)
+        self._name_fill_timer.timeout.connect(self.flush_name_fills)
+
         self.Databases = {
             "RFDB_Server": {
                 "dbname": "RFDB_Server",
@@ -360,6 +367,8 @@ class LoginDialog(QDialog):
         try:
             self.conn = db.connect()
             logger.info("✅ Connected to %s successfully!", selected_db)
+            # One query for the whole employee directory used by name auto-fill
+            EmployeeDirectory.for_handler(db).load()
             return self.conn
         except Exception as e:
             logger.error("Database connection failed: %s", e)
@@ -392,69 +401,95 @@ class LoginDialog(QDialog):
             layer.committedFeaturesAdded.connect(lambda *args: self.sort_attribute_table_by_sno(layer))
             layer.committedFeaturesRemoved.connect(lambda *args: self.sort_attribute_table_by_sno(layer))
             # --- Auto-populate Employee Name ---
-            layer.attributeValueChanged.connect(self.on_production_employee_id_changed)
+            self.connect_name_fill(layer)
             return True
         else:
             print("❌ Error loading editable layer: Layer is not valid.")
             return False
 
     # Mapping of emp_id fields to their corresponding name fields
-    EMP_ID_TO_NAME_FIELD = {
-        "rfdb_production_emp_id": "rfdb_production_done_by",
-        "siloc_production_emp_id": "siloc_production_done_by",
-        "siloc_qc_emp_id": "siloc_qc_done_by",
-        "rfdb_path_association_production_emp_id": "rfdb_path_association_production_done_by",
-        "rfdb_qc_emp_id": "rfdb_qc_done_by",
-        "rfdb_attri_qc_emp_id": "rfdb_attri_qc_done_by",
-        "rfdb_roadtype_qc_emp_id": "rfdb_roadtype_qc_done_by",
-        "rfdb_qa_emp_id": "rfdb_qa_done_by",
-        "rfdb_path_association_qc_emp_id": "rfdb_path_association_qc_done_by"
-    }
-
-    def on_production_employee_id_changed(self, fid, attr_map):
+    EMP_ID_TO_NAME_FIELD = EMP_ID_TO_NAME_FIELD
+    # Changes arriving within this window are filled and committed together
+    NAME_FILL_BATCH_MS = 150
+
+    def connect_name_fill(self, layer):
+        """Connect the batched name fill to `layer`'s attributeValueChanged (once)."""
+        try:
+            layer.attributeValueChanged.disconnect(self.on_production_employee_id_changed)
+        except TypeError:
+            pass  # not connected yet
+        layer.attributeValueChanged.connect(self.on_production_employee_id_changed)
+
+    def on_production_employee_id_changed(self, fid, idx, value):
+        """Queue (fid, emp_id field) for the next batched name fill."""
         layer = self.current_layer
-        if not layer or not layer.isValid():
-            print("Layer is not valid or not set.")
+        if not layer or not layer.isValid() or self._filling_names:
             return
+        field_name = layer.fields().at(idx).name() if idx >= 0 else None
+        if field_name not in self.EMP_ID_TO_NAME_FIELD or not value:
+            return
+        self._pending_name_fills.setdefault(fid, set()).add(field_name)
+        self._name_fill_timer.start(self.NAME_FILL_BATCH_MS)
 
-        for emp_id_field, name_field in self.EMP_ID_TO_NAME_FIELD.items():
-            if emp_id_field in attr_map:
-                employee_id = attr_map[emp_id_field]
-                try:
-                    feature = layer.getFeature(fid)
-                except Exception as e:
-                    print(f"Error fetching feature: {e}")
-                    continue
-                if feature[name_field] or not employee_id:
+    def flush_name_fills(self):
+        """Resolve all pending emp_ids at once and write the names in one edit buffer and one commit."""
+        pending, self._pending_name_fills = self._pending_name_fills, {}
+        layer = self.current_layer
+        if not pending or not layer or not layer.isValid() or self.db_handler is None:
+            return
+        fields = layer.fields()
+
+        # --- Read every pending feature in one request ---
+        request = QgsFeatureRequest().setFilterFids(list(pending))
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        features = {f.id(): f for f in layer.getFeatures(request)}
+
+        wanted = []  # (fid, name field index, emp_id)
+        for fid, emp_id_fields in pending.items():
+            feature = features.get(fid)
+            if feature is None:
+                continue
+            for emp_id_field in emp_id_fields:
+                name_field = self.EMP_ID_TO_NAME_FIELD[emp_id_field]
+                name_idx = fields.indexFromName(name_field)
+                employee_id = feature[emp_id_field]
+                if name_idx == -1 or feature[name_field] or not employee_id:
                     continue
+                wanted.append((fid, name_idx, employee_id))
+        if not wanted:
+            return
 
-                def fetch_and_update(emp_id=employee_id, name_field=name_field, fid=fid):
-                    try:
-                        employee_name = self.fetch_employee_name(emp_id)
-                        if not employee_name:
-                            return
-                        def update_feature():
-                            try:
-                                if not layer.isEditable():
-                                    layer.startEditing()
-                                f = layer.getFeature(fid)
-                                f[name_field] = employee_name
-                                layer.updateFeature(f)
-                                layer.commitChanges()
-                                layer.triggerRepaint()
-                                try:
-                                    dlg = iface.attributeTableDialog(layer)
-                                    if dlg:
-                                        dlg.reload()
-                                except Exception as e:
-                                    print(f"Attribute table refresh error: {e}")
-                            except Exception as e:
-                                print(f"Error updating feature: {e}")
-                        QTimer.singleShot(0, update_feature)
-                    except Exception as e:
-                        print(f"Error fetching employee name for {emp_id_field}: {e}")
+        directory = EmployeeDirectory.for_handler(self.db_handler)
+        names = directory.names_for({emp_id for _, _, emp_id in wanted})
+        changes = [(fid, name_idx, names[emp_id]) for fid, name_idx, emp_id in wanted if emp_id in names]
+        if not changes:
+            return
 
-                threading.Thread(target=fetch_and_update).start()
+        was_editable = layer.isEditable()
+        self._filling_names = True
+        try:
+            if not was_editable:
+                layer.startEditing()
+            layer.beginEditCommand("Auto-fill employee names")
+            for fid, name_idx, employee_name in changes:
+                layer.changeAttributeValue(fid, name_idx, employee_name)
+            layer.endEditCommand()
+            # A session the user already had open keeps its edit buffer (and the
+            # names) uncommitted; only the session opened here is committed
+            if not was_editable and not layer.commitChanges():
+                print(f"Error committing employee names: {layer.commitErrors()}")
+            layer.triggerRepaint()
+            try:
+                dlg = iface.attributeTableDialog(layer)
+                if dlg:
+                    dlg.reload()
+            except Exception as e:
+                print(f"Attribute table refresh error: {e}")
+        except Exception as e:
+            print(f"Error updating features: {e}")
+        finally:
+            self._filling_names = False
+        logger.debug("Auto-filled %d employee name(s) on %d feature(s)", len(changes), len({c[0] for c in changes}))
 
     def load_readonly_layer(self, selected_db, username, password, designation):
         print(f"[DEBUG] Loading read-only layer for {designation} from table: \"public\".\"users_views\"")
@@ -494,6 +529,8 @@ class LoginDialog(QDialog):
         if self.current_layer:
             QgsProject.instance().removeMapLayer(self.current_layer.id())
         self.current_layer = None
+        self._name_fill_timer.stop()
+        self._pending_name_fills = {}
 
         # Close database connection if open
         if self.conn:
@@ -562,13 +599,17 @@ class LoginDialog(QDialog):
     # Example: Fetching something with retries and logging
     def fetch_employee_name(self, emp_id):
         """Fetch the employee name for a given employee ID from the database."""
-        config = self.Databases[self.selected_Database]
-        db = DbHandler(config, self.emp_id, self.db_password)
-        db.selected_table = self.selected_table
+        if self.db_handler is None:
+            return None
+        employee_name = EmployeeDirectory.for_handler(self.db_handler).name_for(emp_id)
+        if employee_name:
+            return employee_name
         try:
-            with db.get_cursor_with_retries() as cur:
-                cur.execute("SELECT employee_name FROM public.employee WHERE employee_id = %s", (emp_id,))
-                result = cur.fetchone()
+            # Not in the directory yet: reuse a pooled background connection
+            with self.db_handler.pooled_connection("background") as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT employee_name FROM public.employee WHERE employee_id = %s", (emp_id,))
+                    result = cur.fetchone()
                 if result:
                     logger.info("Fetched employee name for %s: %s", emp_id, result[0])
                 return result[0] if result else None
@@ -576,8 +617,6 @@ class LoginDialog(QDialog):
             logger.exception("Error fetching employee name for %s", emp_id)
             QMessageBox.critical(self, "Error", f"Error fetching employee name:\n{e}")
             return None
-        finally:
-            db.cleanup()
 
     #upload_csv_dialog placeholder previous implementation
 
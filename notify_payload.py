@@ -0,0 +1,104 @@
+"""
+notify_payload.py
+
+JSON payloads for the per-table change channels ('NOTIFY <table>_update',
+e.g. production_inputs_update / tm_production_inputs_update). A change
+payload carries the new cell values, so subscribers patch their model
+instead of re-querying the row:
+
+    {"table": "public.production_inputs", "sub": "Texas", "ts": 1718000000.123,
+     "src": "3f9a1c0e", "rows": {"<s_no>": {"<column>": <value>, ...}, ...}}
+
+"sub" is the subcountry of every row in the payload (omitted if unknown),
+"ts" is the sender's clock and "src" identifies the sending dialog (so it
+can skip its own echo). Rows too large for PostgreSQL's 8000-byte NOTIFY
+limit are sent id-only as {"ids": ["<s_no>", ...]} and re-fetched by the
+receiver; deleted rows arrive as {"deleted": [...]} (database triggers,
+see sql/change_notify_triggers.sql). Plain comma-separated s_no payloads
+are still understood.
+"""
+
+import json
+import time
+
+NOTIFY_PAYLOAD_LIMIT = 7900  # bytes; PostgreSQL rejects payloads of 8000 or more
+
+
+def notify_channel(table):
+    """Change channel for `table` ("tm_production_inputs" -> "tm_production_inputs_update")."""
+    return table.replace('"', '').split('.')[-1] + "_update"
+
+
+def _dumps(obj):
+    # Decimal / date / datetime go out as text; coerce_value() converts them back
+    return json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False)
+
+
+def _size(text):
+    return len(text.encode("utf-8"))
+
+
+def _header(table, subcountry, source):
+    header = {"table": table, "ts": round(time.time(), 3), "src": source}
+    if subcountry is not None:
+        header["sub"] = subcountry
+    return header
+
+
+def encode_changes(table, changes, source=None, subcountry=None, limit=NOTIFY_PAYLOAD_LIMIT):
+    """Yield JSON payloads for {s_no: {column: value}}, each at most `limit` bytes."""
+    header = _header(table, subcountry, source)
+    base = _size(_dumps({**header, "rows": {}}))
+    oversized = []
+
+    rows, size = {}, base
+    for s_no, values in changes.items():
+        key = str(s_no)
+        entry = _size(_dumps({key: values})) - 1  # '"key":{...}' plus a separating comma
+        if base + entry > limit:
+            oversized.append(key)
+            continue
+        if rows and size + entry > limit:
+            yield _dumps({**header, "rows": rows})
+            rows, size = {}, base
+        rows[key] = values
+        size += entry
+    if rows:
+        yield _dumps({**header, "rows": rows})
+
+    yield from encode_ids(table, oversized, source, subcountry, limit)
+
+
+def encode_ids(table, s_nos, source=None, subcountry=None, limit=NOTIFY_PAYLOAD_LIMIT):
+    """Yield id-only JSON payloads (receivers re-fetch these rows)."""
+    header = _header(table, subcountry, source)
+    base = _size(_dumps({**header, "ids": []}))
+    ids, size = [], base
+    for s_no in map(str, s_nos):
+        entry = _size(_dumps(s_no)) + 1
+        if ids and size + entry > limit:
+            yield _dumps({**header, "ids": ids})
+            ids, size = [], base
+        ids.append(s_no)
+        size += entry
+    if ids:
+        yield _dumps({**header, "ids": ids})
+
+
+def decode_payload(payload):
+    """
+    Parse a NOTIFY payload into {"table", "sub", "ts", "src", "rows", "ids", "deleted"}.
+    Legacy comma-separated payloads come back with only "ids" set.
+    """
+    text = str(payload or "").strip()
+    change = {"table": None, "sub": None, "ts": None, "src": None, "rows": {}, "ids": [], "deleted": []}
+    if text.startswith("{"):
+        try:
+            # Fractions stay text so coerce_value() picks Decimal or float by column type
+            data = json.loads(text, parse_float=str)
+        except ValueError:
+            return change
+        change.update({key: data[key] for key in change if data.get(key) is not None})
+        return change
+    change["ids"] = [s_no.strip() for s_no in text.split(",") if s_no.strip()]
+    return change
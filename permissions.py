@@ -0,0 +1,93 @@
+"""
+permissions.py
+
+Compiled form of EDITABLE_FIELDS. A PermissionMatrix is built once per
+(table, role, project, user) and answers "which columns of this row are
+editable" as a column bitmask, without rebuilding lookup tables per cell.
+The rules are the same as is_field_editable below (the per-cell check).
+"""
+
+from functools import lru_cache
+
+from .constants import EDITABLE_FIELDS, RFDB_LEADER_COLUMNS, TM_LEADER_COLUMNS
+
+
+@lru_cache(maxsize=None)
+def compile_rules(table_name, role, project):
+    """Return (editable field names, leader column or None) for a table/role."""
+    if table_name:
+        fields = EDITABLE_FIELDS.get(table_name, {}).get(role, [])
+    else:
+        fields = EDITABLE_FIELDS.get(role, [])
+    if role == "grand_leaders":
+        # Grand leaders: no row-wise restriction
+        return frozenset(fields), None
+    if project == "turn_maneuver_project":
+        leader_col = TM_LEADER_COLUMNS.get(role)
+    else:
+        leader_col = RFDB_LEADER_COLUMNS.get(role)
+    return frozenset(fields), leader_col
+
+
+class PermissionMatrix:
+    """Editable-column bitmask for a column layout, plus the leader-row predicate."""
+
+    def __init__(self, columns, role, table_name, project=None, user_emp_id=None):
+        fields, leader_col = compile_rules(table_name, role, project)
+        self.columns = list(columns)
+        self.column_mask = 0
+        for col, name in enumerate(self.columns):
+            if name in fields:
+                self.column_mask |= 1 << col
+        self.leader_col = leader_col
+        # Row restriction only applies when we know who the user is
+        self.restricted = bool(self.column_mask) and leader_col is not None and user_emp_id is not None
+        self.leader_idx = self.columns.index(leader_col) if self.restricted and leader_col in self.columns else None
+        self.user_emp_id = None if user_emp_id is None else str(user_emp_id)
+
+    def row_mask(self, row):
+        """Bitmask of editable columns for one row (tuple ordered like self.columns)."""
+        if not self.restricted:
+            return self.column_mask
+        if self.leader_idx is None:
+            return 0  # leader column not loaded: never the user's row
+        return self.column_mask if str(row[self.leader_idx]) == self.user_emp_id else 0
+
+    def row_masks(self, rows):
+        """row_mask() for many rows; unrestricted roles skip the per-row test."""
+        if not self.restricted:
+            return [self.column_mask] * len(rows)
+        if self.leader_idx is None:
+            return [0] * len(rows)
+        idx, emp, mask = self.leader_idx, self.user_emp_id, self.column_mask
+        return [mask if str(row[idx]) == emp else 0 for row in rows]
+
+
+# Function to check if a field is editable by the user role
+def is_field_editable(role, field_name, row_data=None, user_emp_id=None, project=None, table_name=None):
+    # Use table_name for lookup
+    editable_fields = []
+    if table_name:
+        editable_fields = EDITABLE_FIELDS.get(table_name, {}).get(role, [])
+    else:
+        editable_fields = EDITABLE_FIELDS.get(role, [])
+
+
+    if field_name not in editable_fields:
+        return False
+
+    # Grand leaders: no row-wise restriction
+    if role == "grand_leaders":
+        return True
+
+    # Select the correct map based on project
+    leader_col = None
+    if project == "turn_maneuver_project":
+        leader_col = TM_LEADER_COLUMNS.get(role)
+    else:
+        leader_col = RFDB_LEADER_COLUMNS.get(role)
+
+    if leader_col and row_data and user_emp_id is not None:
+        leader_emp_id = row_data.get(leader_col)
+        return str(leader_emp_id) == str(user_emp_id)
+    return True  # If no row restriction, allow
@@ -0,0 +1,318 @@
+import logging
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+
+from .cell_values import to_text, coerce_value, sorted_rows
+from .filter_engine import ColumnIndex
+
+logger = logging.getLogger(__name__)
+
+READONLY_BACKGROUND = QColor(180, 180, 180)
+
+
+class PortalTableModel(QAbstractTableModel):
+    """Column-oriented model behind the portal table view.
+
+    Every column is a plain list of the native values psycopg2 returned
+    (int, Decimal, date, str, None) indexed by storage row; text is only
+    produced when the view asks for it in data().  Sorting permutes a
+    view-row -> storage-row list instead of moving the columns.
+    """
+
+    # Emitted when a cell is changed through the view (editor/delegate),
+    # the model equivalent of QTableWidget.cellChanged.
+    cellEdited = pyqtSignal(int, int)
+    editRejected = pyqtSignal(str, str)  # (column, reason) for input that does not fit the column type
+
+    def __init__(self, columns, parent=None, key_column="s_no"):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._col_index = {name: col for col, name in enumerate(self.columns)}
+        self.col_types = {}
+        self._header_labels = list(self.columns)
+        self._data = [[] for _ in self.columns]
+        self._editable = []  # per storage row: bitmask of editable columns
+        self._order = []  # view row -> storage row
+        self._key_col = self.columns.index(key_column) if key_column in self.columns else None
+        self._rid_by_key = {}  # key text -> storage row; unaffected by sorting/filtering
+        self._row_of = None  # storage row -> view row, rebuilt lazily after a sort
+        self._permissions = None  # PermissionMatrix computing the _editable masks
+        self.filter_index = ColumnIndex(self._data, to_text)
+        self.sort_columns = []  # [(col, Qt.SortOrder), ...] most significant first
+
+    # --- Loading ---
+    def load(self, rows, editable_masks=None):
+        """Replace the model contents with `rows` (sequence of tuples)."""
+        self.beginResetModel()
+        if rows:
+            self._data = [list(col) for col in zip(*rows)]
+        else:
+            self._data = [[] for _ in self.columns]
+        count = len(rows)
+        if editable_masks is None:
+            editable_masks = self._masks_for(rows)
+        self._editable = list(editable_masks)
+        self._order = list(range(count))
+        self._rebuild_key_index()
+        self.filter_index.reset(self._data)
+        self.endResetModel()
+
+    def append_rows(self, rows, editable_masks=None):
+        """Append `rows` after the current last row (used by streaming loads)."""
+        if not rows:
+            return
+        first = len(self._order)
+        base = len(self._editable)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for column, values in zip(self._data, zip(*rows)):
+            column.extend(values)
+        if editable_masks is None:
+            editable_masks = self._masks_for(rows)
+        self._editable.extend(editable_masks)
+        self._order.extend(range(base, base + len(rows)))
+        self.filter_index.rows_appended(base, len(rows))
+        if self._key_col is not None:
+            keys = self._data[self._key_col]
+            self._rid_by_key.update((to_text(keys[rid]), rid) for rid in range(base, base + len(rows)))
+        if self._row_of is not None:
+            self._row_of.extend(range(first, first + len(rows)))
+        self.endInsertRows()
+
+    def _rebuild_key_index(self):
+        self._row_of = None
+        if self._key_col is None:
+            self._rid_by_key = {}
+            return
+        self._rid_by_key = {to_text(key): rid for rid, key in enumerate(self._data[self._key_col])}
+
+    def set_permissions(self, permissions):
+        """Use a PermissionMatrix for editability; masks are cached per storage row."""
+        self._permissions = permissions
+
+    def _masks_for(self, rows):
+        if self._permissions is None:
+            return [(1 << len(self.columns)) - 1] * len(rows)
+        return self._permissions.row_masks(rows)
+
+    def _refresh_mask(self, rid, row):
+        """Recompute one row's mask; only needed when its leader column changed."""
+        if self._permissions is None:
+            return
+        mask = self._permissions.row_mask([column[rid] for column in self._data])
+        if mask != self._editable[rid]:
+            self._editable[rid] = mask
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1),
+                                  [Qt.BackgroundRole])
+
+    def _is_leader_col(self, col):
+        return self._permissions is not None and col == self._permissions.leader_idx
+
+    def set_column_types(self, col_types):
+        """information_schema data types, used to convert edited text to native values."""
+        self.col_types = dict(col_types)
+
+    def coerce(self, col, value):
+        """Native value for `value` in column `col`; raises ValueError if it does not fit."""
+        return coerce_value(value, self.col_types.get(self.columns[col], "text"))
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        rid = self._order[index.row()]
+        col = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return to_text(self._data[col][rid])
+        if role == Qt.BackgroundRole and not self._editable[rid] >> col & 1:
+            return READONLY_BACKGROUND
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if self._editable[self._order[index.row()]] >> index.column() & 1:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        try:
+            value = self.coerce(col, value)
+        except ValueError as e:
+            logger.warning("Rejected edit for %s: %s", self.columns[col], e)
+            self.editRejected.emit(self.columns[col], str(e))
+            return False
+        rid = self._order[row]
+        if self._data[col][rid] == value:
+            return False
+        self._store(rid, col, value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        if self._is_leader_col(col):
+            self._refresh_mask(rid, row)
+        self.cellEdited.emit(row, col)
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self._header_labels):
+                return self._header_labels[section]
+            return None
+        return str(section + 1)
+
+    def setHeaderData(self, section, orientation, value, role=Qt.EditRole):
+        if orientation != Qt.Horizontal or not 0 <= section < len(self._header_labels):
+            return False
+        self._header_labels[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Single-column sort (QTableView entry point)."""
+        if 0 <= column < len(self.columns):
+            self.sort_by([(column, order)])
+
+    def sort_by(self, sort_columns):
+        """
+        Stable multi-column sort on the native values; `sort_columns` is
+        [(col, order), ...] with the most significant first. Empty/NULL cells
+        always go last.
+        """
+        sort_columns = [(c, o) for c, o in sort_columns if 0 <= c < len(self.columns)]
+        if not sort_columns:
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_rids = [self._order[i.row()] for i in persistent]
+        self._order = sorted_rows(
+            self._order, self._data, [(c, o == Qt.DescendingOrder) for c, o in sort_columns]
+        )
+        self.sort_columns = sort_columns
+        self._row_of = None
+        row_of = {rid: row for row, rid in enumerate(self._order)}
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(row_of[rid], i.column()) for rid, i in zip(persistent_rids, persistent)]
+        )
+        self.layoutChanged.emit()
+
+    # --- Cell access used by the dialog ---
+    def _store(self, rid, col, value):
+        old = self._data[col][rid]
+        self._data[col][rid] = value
+        self.filter_index.cell_changed(rid, col, to_text(old), to_text(value))
+
+    def value(self, row, col):
+        """Native value of a cell (None for NULL)."""
+        return self._data[col][self._order[row]]
+
+    def text(self, row, col):
+        """Display text of a cell."""
+        return to_text(self._data[col][self._order[row]])
+
+    def set_value(self, row, col, value):
+        """Programmatic update; text is converted to the column type. No cellEdited."""
+        rid = self._order[row]
+        self._store(rid, col, self.coerce(col, value))
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        if self._is_leader_col(col):
+            self._refresh_mask(rid, row)
+
+    def set_row_values(self, row, values):
+        """Replace a whole row with native `values` (ordered like self.columns)."""
+        rid = self._order[row]
+        if self._key_col is not None:
+            self._rid_by_key.pop(to_text(self._data[self._key_col][rid]), None)
+        for col, value in enumerate(values):
+            self._store(rid, col, value)
+        if self._key_col is not None:
+            self._rid_by_key[to_text(self._data[self._key_col][rid])] = rid
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+        if self._permissions is not None and self._permissions.leader_idx is not None:
+            self._refresh_mask(rid, row)
+
+    def merge_rows(self, rows):
+        """Update rows whose key is already loaded and append the rest (delta refresh)."""
+        new_rows = []
+        for values in rows:
+            row = self.row_for_key(values[self._key_col])
+            if row >= 0:
+                self.set_row_values(row, values)
+            else:
+                new_rows.append(values)
+        self.append_rows(new_rows)
+        return len(rows) - len(new_rows), len(new_rows)
+
+    def keys(self):
+        """Key texts of every loaded row."""
+        return set(self._rid_by_key)
+
+    def remove_keys(self, keys):
+        """Remove the rows with these key texts, then compact the column storage."""
+        doomed = {self._rid_by_key[key] for key in keys if key in self._rid_by_key}
+        if not doomed:
+            return 0
+        view_rows = sorted(self.view_row(rid) for rid in doomed)
+        # Contiguous view-row ranges, removed from the bottom up
+        ranges = []
+        for row in view_rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._order[first:last + 1]
+            self._row_of = None
+            self.endRemoveRows()
+        keep = [rid for rid in range(len(self._editable)) if rid not in doomed]
+        new_rid = [-1] * len(self._editable)
+        for new, old in enumerate(keep):
+            new_rid[old] = new
+        self._data = [[column[rid] for rid in keep] for column in self._data]
+        self._editable = [self._editable[rid] for rid in keep]
+        self._order = [new_rid[rid] for rid in self._order]
+        self._rebuild_key_index()
+        self.filter_index.rows_removed(new_rid, self._data)
+        return len(doomed)
+
+    def storage_row(self, row):
+        return self._order[row]
+
+    def view_row(self, rid):
+        """Inverse of storage_row(), via the lazily rebuilt storage -> view map."""
+        if self._row_of is None:
+            self._row_of = [0] * len(self._order)
+            for row, r in enumerate(self._order):
+                self._row_of[r] = row
+        return self._row_of[rid]
+
+    def column_of(self, name):
+        """Logical column of `name`, or -1. Header drags move sections, not columns."""
+        return self._col_index.get(name, -1)
+
+    def row_for_key(self, key):
+        """View row holding the record whose key column equals `key`, or -1."""
+        rid = self._rid_by_key.get(to_text(key))
+        if rid is None:
+            return -1
+        return self.view_row(rid)
+
+    def row_dict(self, row):
+        rid = self._order[row]
+        return {name: self._data[c][rid] for c, name in enumerate(self.columns)}
+
+    def is_editable(self, row, col):
+        return bool(self._editable[self._order[row]] >> col & 1)
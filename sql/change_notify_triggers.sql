@@ -0,0 +1,177 @@
+-- change_notify_triggers.sql
+--
+-- Statement-level change notifications for the portal tables. Every
+-- INSERT/UPDATE/DELETE statement, from the portal, the QGIS layer, CSV
+-- upload or any other SQL client, publishes its changed rows on
+-- '<table>_update' using the JSON format of notify_payload.py:
+--
+--   UPDATE  {"table", "sub", "ts", "src", "rows": {"<s_no>": {"<column>": <value>}}}
+--   INSERT  {"table", "sub", "ts", "src", "ids": ["<s_no>", ...]}
+--   DELETE  {"table", "sub", "ts", "src", "deleted": ["<s_no>", ...]}
+--
+-- One notification per statement, split per subcountry and whenever a
+-- payload would exceed the 8000-byte NOTIFY limit. Rows that do not fit
+-- (or whose geometry changed) are sent as "ids" and re-fetched by clients.
+-- Clients identify their own writes with: SET LOCAL wap.notify_source = '<id>'.
+--
+-- Requires PostgreSQL 10+ (transition tables). Safe to run again.
+
+CREATE OR REPLACE FUNCTION public.wap_notify_header(sub text)
+RETURNS jsonb LANGUAGE sql VOLATILE AS $$  -- clock_timestamp() changes within a statement
+    SELECT jsonb_strip_nulls(jsonb_build_object(
+        'sub', sub,
+        'ts', round(extract(epoch FROM clock_timestamp())::numeric, 3),
+        'src', nullif(current_setting('wap.notify_source', true), '')
+    ));
+$$;
+
+-- Send `keys` under "ids" or "deleted", in as many payloads as needed.
+CREATE OR REPLACE FUNCTION public.wap_notify_keys(channel text, header jsonb, key text, keys text[])
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    base integer := octet_length(header::text) + octet_length(key) + 8;
+    size integer := base;
+    batch text[] := '{}';
+    k text;
+BEGIN
+    FOREACH k IN ARRAY keys LOOP
+        IF cardinality(batch) > 0 AND size + octet_length(k) + 4 > 7800 THEN
+            PERFORM pg_notify(channel, (header || jsonb_build_object(key, batch))::text);
+            batch := '{}';
+            size := base;
+        END IF;
+        batch := batch || k;
+        size := size + octet_length(k) + 4;
+    END LOOP;
+    IF cardinality(batch) > 0 THEN
+        PERFORM pg_notify(channel, (header || jsonb_build_object(key, batch))::text);
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.wap_notify_changes()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    channel text := TG_TABLE_NAME || '_update';
+    table_ref jsonb := jsonb_build_object('table', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME);
+    header jsonb;
+    grp record;
+    r record;
+    started boolean := false;
+    cur_sub text;
+    rows_obj jsonb := '{}';
+    refetch text[] := '{}';
+    base integer;
+    size integer;
+    entry jsonb;
+    entry_size integer;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR grp IN
+            SELECT to_jsonb(n) ->> 'subcountry' AS sub, array_agg((to_jsonb(n) ->> 's_no')) AS keys
+            FROM new_rows n GROUP BY 1
+        LOOP
+            PERFORM public.wap_notify_keys(channel, public.wap_notify_header(grp.sub) || table_ref, 'ids', grp.keys);
+        END LOOP;
+        RETURN NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        FOR grp IN
+            SELECT to_jsonb(o) ->> 'subcountry' AS sub, array_agg((to_jsonb(o) ->> 's_no')) AS keys
+            FROM old_rows o GROUP BY 1
+        LOOP
+            PERFORM public.wap_notify_keys(channel, public.wap_notify_header(grp.sub) || table_ref, 'deleted', grp.keys);
+        END LOOP;
+        RETURN NULL;
+    END IF;
+
+    -- UPDATE: only the columns whose value changed; a row moving between
+    -- subcountries is sent without "sub" so clients on both sides see it.
+    FOR r IN
+        SELECT n.j ->> 's_no' AS s_no,
+               CASE WHEN n.j -> 'subcountry' IS NOT DISTINCT FROM o.j -> 'subcountry'
+                    THEN n.j ->> 'subcountry' END AS sub,
+               CASE WHEN n.j -> 'geom' IS DISTINCT FROM o.j -> 'geom' THEN NULL
+                    ELSE (SELECT coalesce(jsonb_object_agg(nv.key, nv.value), '{}')
+                          FROM jsonb_each(n.j - 'geom') AS nv
+                          WHERE nv.value IS DISTINCT FROM o.j -> nv.key) END AS vals
+        FROM (SELECT to_jsonb(x) AS j FROM new_rows x) AS n
+        JOIN (SELECT to_jsonb(y) AS j FROM old_rows y) AS o ON o.j -> 's_no' = n.j -> 's_no'
+        ORDER BY 2
+    LOOP
+        IF NOT started OR r.sub IS DISTINCT FROM cur_sub THEN
+            IF started THEN
+                IF rows_obj <> '{}' THEN
+                    PERFORM pg_notify(channel, (header || jsonb_build_object('rows', rows_obj))::text);
+                END IF;
+                PERFORM public.wap_notify_keys(channel, header, 'ids', refetch);
+            END IF;
+            started := true;
+            cur_sub := r.sub;
+            header := public.wap_notify_header(cur_sub) || table_ref;
+            base := octet_length(header::text) + 16;
+            size := base;
+            rows_obj := '{}';
+            refetch := '{}';
+        END IF;
+
+        IF r.vals IS NULL THEN
+            refetch := refetch || r.s_no;
+            CONTINUE;
+        END IF;
+        IF r.vals = '{}' THEN
+            CONTINUE;  -- no-op update
+        END IF;
+        entry := jsonb_build_object(r.s_no, r.vals);
+        entry_size := octet_length(entry::text);
+        IF base + entry_size > 7800 THEN
+            refetch := refetch || r.s_no;
+            CONTINUE;
+        END IF;
+        IF rows_obj <> '{}' AND size + entry_size > 7800 THEN
+            PERFORM pg_notify(channel, (header || jsonb_build_object('rows', rows_obj))::text);
+            rows_obj := '{}';
+            size := base;
+        END IF;
+        rows_obj := rows_obj || entry;
+        size := size + entry_size;
+    END LOOP;
+
+    IF started THEN
+        IF rows_obj <> '{}' THEN
+            PERFORM pg_notify(channel, (header || jsonb_build_object('rows', rows_obj))::text);
+        END IF;
+        PERFORM public.wap_notify_keys(channel, header, 'ids', refetch);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    table_name text;
+    tbl regclass;
+BEGIN
+    FOREACH table_name IN ARRAY ARRAY['public.production_inputs', 'public.tm_production_inputs'] LOOP
+        tbl := to_regclass(table_name);
+        IF tbl IS NULL THEN
+            RAISE NOTICE 'Skipping %: table not found', table_name;
+            CONTINUE;
+        END IF;
+        EXECUTE format('DROP TRIGGER IF EXISTS wap_notify_update ON %s', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS wap_notify_insert ON %s', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS wap_notify_delete ON %s', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER wap_notify_update AFTER UPDATE ON %s '
+            'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE PROCEDURE public.wap_notify_changes()', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER wap_notify_insert AFTER INSERT ON %s '
+            'REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE PROCEDURE public.wap_notify_changes()', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER wap_notify_delete AFTER DELETE ON %s '
+            'REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE PROCEDURE public.wap_notify_changes()', tbl);
+    END LOOP;
+END;
+$$;
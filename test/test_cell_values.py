@@ -0,0 +1,74 @@
+# coding=utf-8
+"""Cell value conversion and row ordering tests (no QGIS needed)."""
+
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from ..cell_values import coerce_value, sorted_rows, to_text
+
+
+class CoerceValueTest(unittest.TestCase):
+    """coerce_value converts edited text to the column's native type."""
+
+    def test_types(self):
+        self.assertEqual(coerce_value(" 42 ", "integer"), 42)
+        self.assertEqual(coerce_value("1.50", "numeric"), Decimal("1.50"))
+        self.assertEqual(coerce_value("2.5", "double precision"), 2.5)
+        self.assertEqual(coerce_value("2025-05-21", "date"), date(2025, 5, 21))
+        self.assertEqual(coerce_value("2025-05-21T10:30:00", "date"), date(2025, 5, 21))
+        self.assertEqual(coerce_value("2025-05-21 10:30:00", "timestamp without time zone"),
+                         datetime(2025, 5, 21, 10, 30))
+        self.assertIs(coerce_value("Yes", "boolean"), True)
+        self.assertIs(coerce_value("f", "boolean"), False)
+        self.assertEqual(coerce_value(" keep spaces ", "text"), " keep spaces ")
+
+    def test_empty_is_null(self):
+        for dtype in ("integer", "numeric", "date", "text", "boolean"):
+            self.assertIsNone(coerce_value("  ", dtype))
+
+    def test_native_values_pass_through(self):
+        self.assertEqual(coerce_value(7, "integer"), 7)
+        self.assertIsNone(coerce_value(None, "date"))
+
+    def test_invalid_input_raises_value_error(self):
+        for value, dtype in (("abc", "integer"), ("1,5", "numeric"), ("x", "real"),
+                             ("21/05/2025", "date"), ("maybe", "boolean")):
+            with self.assertRaises(ValueError, msg=(value, dtype)):
+                coerce_value(value, dtype)
+
+    def test_to_text(self):
+        self.assertEqual(to_text(None), "")
+        self.assertEqual(to_text(Decimal("1.50")), "1.50")
+
+
+class SortedRowsTest(unittest.TestCase):
+    """sorted_rows: multi-column, stable, NULLs last."""
+
+    def test_nulls_last_both_directions(self):
+        data = [[3, None, 1, "", 2]]
+        order = list(range(5))
+        self.assertEqual(sorted_rows(order, data, [(0, False)]), [2, 4, 0, 1, 3])
+        self.assertEqual(sorted_rows(order, data, [(0, True)]), [0, 4, 2, 1, 3])
+
+    def test_multi_column_and_stable(self):
+        data = [["b", "a", "b", "a"], [2, 2, 1, 1]]
+        order = [0, 1, 2, 3]
+        self.assertEqual(sorted_rows(order, data, [(0, False), (1, False)]), [3, 1, 2, 0])
+        self.assertEqual(sorted_rows(order, data, [(0, False), (1, True)]), [1, 3, 0, 2])
+        # Ties keep the incoming order
+        self.assertEqual(sorted_rows([3, 1, 2, 0], data, [(0, False)]), [3, 1, 2, 0])
+
+    def test_mixed_types_fall_back_to_text(self):
+        data = [[10, "9", None, 2]]
+        self.assertEqual(sorted_rows([0, 1, 2, 3], data, [(0, False)]), [0, 3, 1, 2])
+
+    def test_returns_new_list(self):
+        order = [1, 0]
+        result = sorted_rows(order, [[1, 0]], [])
+        self.assertEqual(result, [1, 0])
+        self.assertIsNot(result, order)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# coding=utf-8
+"""Bitset filter index tests (no QGIS needed)."""
+
+import unittest
+
+from ..filter_engine import ColumnIndex, bitset, iter_bits, popcount
+
+
+class BitsetTest(unittest.TestCase):
+    """bitset / popcount / iter_bits."""
+
+    def test_bitset_round_trip(self):
+        rids = [0, 3, 7, 8, 20]
+        bits = bitset(rids, 21)
+        self.assertEqual(bits, sum(1 << rid for rid in rids))
+        self.assertEqual(iter_bits(bits), rids)
+        self.assertEqual(popcount(bits), len(rids))
+
+    def test_empty(self):
+        self.assertEqual(bitset([], 0), 0)
+        self.assertEqual(iter_bits(0), [])
+        self.assertEqual(popcount(0), 0)
+
+
+class ColumnIndexTest(unittest.TestCase):
+    """ColumnIndex postings, counts and incremental updates."""
+
+    def setUp(self):
+        """Runs before each test."""
+        # Columnar storage: column 0 = status, column 1 = emp_id
+        self.data = [
+            ["Done", "WIP", None, "Done", "WIP"],
+            [101, 102, 101, None, 103],
+        ]
+        self.index = ColumnIndex(self.data, lambda v: "" if v is None else str(v))
+
+    def test_postings_keyed_by_text(self):
+        postings = self.index.postings(1)
+        self.assertEqual(iter_bits(postings["101"]), [0, 2])
+        self.assertEqual(iter_bits(postings[""]), [3])
+        self.assertEqual(self.index.counts(0), {"Done": 2, "WIP": 2, "": 1})
+
+    def test_matching_intersects_columns(self):
+        rows = self.index.matching({0: ["Done", "WIP"], 1: ["101"]})
+        self.assertEqual(iter_bits(rows), [0])
+        self.assertEqual(self.index.matching({0: []}), 0)
+        self.assertEqual(self.index.matching({}), self.index.all_rows)
+
+    def test_matching_except_col(self):
+        filters = {0: ["WIP"], 1: ["101"]}
+        self.assertEqual(iter_bits(self.index.matching(filters, except_col=1)), [1, 4])
+
+    def test_value_counts_within_rows(self):
+        rows = bitset([0, 1, 2], self.index.size)
+        self.assertEqual(self.index.value_counts(0, rows), {"Done": 1, "WIP": 1, "": 1})
+        self.assertEqual(sorted(self.index.values_within(1, rows)), ["101", "102"])
+        self.assertEqual(self.index.value_counts(0), self.index.counts(0))
+
+    def test_cell_changed_moves_row(self):
+        self.index.postings(0)
+        self.data[0][2] = "Done"
+        self.index.cell_changed(2, 0, "", "Done")
+        self.assertNotIn("", self.index.postings(0))
+        self.assertEqual(iter_bits(self.index.postings(0)["Done"]), [0, 2, 3])
+        self.assertEqual(self.index.counts(0)["Done"], 3)
+        # The incremental result matches a rebuild
+        rebuilt = ColumnIndex(self.data, lambda v: "" if v is None else str(v))
+        self.assertEqual(rebuilt.postings(0), self.index.postings(0))
+
+    def test_cell_changed_ignores_unbuilt_column(self):
+        self.index.cell_changed(0, 1, "101", "999")
+        self.assertNotIn("999", self.index.postings(1))
+
+    def _rebuilt(self):
+        rebuilt = ColumnIndex(self.data, lambda v: "" if v is None else str(v))
+        return rebuilt.postings(0), rebuilt.counts(0)
+
+    def test_rows_appended_extends_built_columns(self):
+        self.index.postings(0)
+        self.data[0].extend(["WIP", None, "New"])
+        self.data[1].extend([104, 105, 106])
+        self.index.rows_appended(5, 3)
+        self.assertEqual((self.index.postings(0), self.index.counts(0)), self._rebuilt())
+        self.assertEqual(iter_bits(self.index.postings(0)["New"]), [7])
+        # Columns never filtered stay unbuilt until first use
+        self.assertNotIn(1, self.index._postings)
+        self.assertEqual(iter_bits(self.index.postings(1)["106"]), [7])
+
+    def test_rows_removed_renumbers_postings(self):
+        self.index.postings(0)
+        keep = [0, 2, 4]
+        new_rid = [-1] * 5
+        for new, old in enumerate(keep):
+            new_rid[old] = new
+        self.data = [[column[rid] for rid in keep] for column in self.data]
+        self.index.rows_removed(new_rid, self.data)
+        self.assertEqual(self.index.size, 3)
+        self.assertEqual((self.index.postings(0), self.index.counts(0)), self._rebuilt())
+        self.assertEqual(iter_bits(self.index.postings(0)["WIP"]), [2])
+
+    def test_reset(self):
+        self.index.postings(0)
+        self.index.reset([["a", "b"]])
+        self.assertEqual(self.index.size, 2)
+        self.assertEqual(self.index.counts(0), {"a": 1, "b": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
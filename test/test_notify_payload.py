@@ -0,0 +1,71 @@
+# coding=utf-8
+"""NOTIFY payload encoding tests (no QGIS needed)."""
+
+import json
+import unittest
+
+from ..notify_payload import (
+    NOTIFY_PAYLOAD_LIMIT, decode_payload, encode_changes, encode_ids, notify_channel)
+
+
+class NotifyPayloadTest(unittest.TestCase):
+    """encode_changes / encode_ids / decode_payload."""
+
+    def test_notify_channel(self):
+        self.assertEqual(notify_channel('"public"."tm_production_inputs"'), "tm_production_inputs_update")
+        self.assertEqual(notify_channel("production_inputs"), "production_inputs_update")
+
+    def test_round_trip(self):
+        changes = {12: {"rfdb_production_status": "Done", "rfdb_production_time_taken": 1.5}}
+        payloads = list(encode_changes("public.production_inputs", changes, source="abc", subcountry="Texas"))
+        self.assertEqual(len(payloads), 1)
+        change = decode_payload(payloads[0])
+        self.assertEqual(change["table"], "public.production_inputs")
+        self.assertEqual(change["sub"], "Texas")
+        self.assertEqual(change["src"], "abc")
+        self.assertEqual(change["ids"], [])
+        # Fractions come back as text for coerce_value()
+        self.assertEqual(change["rows"], {"12": {"rfdb_production_status": "Done",
+                                                 "rfdb_production_time_taken": "1.5"}})
+
+    def test_payloads_stay_under_limit(self):
+        changes = {s_no: {"rfdb_production_remarks": "x" * 500} for s_no in range(100)}
+        payloads = list(encode_changes("public.production_inputs", changes))
+        self.assertGreater(len(payloads), 1)
+        received = {}
+        for payload in payloads:
+            self.assertLessEqual(len(payload.encode("utf-8")), NOTIFY_PAYLOAD_LIMIT)
+            received.update(decode_payload(payload)["rows"])
+        self.assertEqual(sorted(received, key=int), [str(s_no) for s_no in range(100)])
+
+    def test_multibyte_text_counted_in_bytes(self):
+        changes = {s_no: {"remarks": "ட" * 300} for s_no in range(30)}
+        for payload in encode_changes("public.production_inputs", changes):
+            self.assertLessEqual(len(payload.encode("utf-8")), NOTIFY_PAYLOAD_LIMIT)
+
+    def test_oversized_row_falls_back_to_ids(self):
+        changes = {1: {"remarks": "short"}, 2: {"remarks": "y" * 9000}}
+        decoded = [decode_payload(p) for p in encode_changes("public.production_inputs", changes)]
+        self.assertEqual(decoded[0]["rows"], {"1": {"remarks": "short"}})
+        self.assertEqual(decoded[1]["rows"], {})
+        self.assertEqual(decoded[1]["ids"], ["2"])
+
+    def test_encode_ids_splits(self):
+        payloads = list(encode_ids("public.production_inputs", range(5000), limit=1000))
+        self.assertGreater(len(payloads), 1)
+        ids = []
+        for payload in payloads:
+            self.assertLessEqual(len(payload.encode("utf-8")), 1000)
+            ids.extend(json.loads(payload)["ids"])
+        self.assertEqual(ids, [str(s_no) for s_no in range(5000)])
+
+    def test_legacy_and_bad_payloads(self):
+        self.assertEqual(decode_payload("1, 2,,3")["ids"], ["1", "2", "3"])
+        self.assertEqual(decode_payload(None)["ids"], [])
+        broken = decode_payload("{not json")
+        self.assertEqual((broken["rows"], broken["ids"]), ({}, []))
+        self.assertEqual(decode_payload('{"deleted": ["7"]}')["deleted"], ["7"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# coding=utf-8
+"""PermissionMatrix tests against the per-cell is_field_editable rules."""
+
+import unittest
+
+from ..constants import EDITABLE_FIELDS, RFDB_LEADER_COLUMNS, TM_LEADER_COLUMNS
+from ..permissions import PermissionMatrix, is_field_editable
+
+PROJECTS = ("rfdb_project", "turn_maneuver_project")
+
+
+class PermissionMatrixTest(unittest.TestCase):
+    """PermissionMatrix must agree with is_field_editable for every cell."""
+
+    def _columns(self, table_name):
+        columns = {"s_no"}
+        for fields in EDITABLE_FIELDS[table_name].values():
+            columns.update(fields)
+        columns.update(RFDB_LEADER_COLUMNS.values())
+        columns.update(TM_LEADER_COLUMNS.values())
+        return sorted(columns)
+
+    def _rows(self, columns):
+        # The user's own rows, someone else's rows and unassigned rows
+        return [tuple(value for _ in columns) for value in ("E100", "E200", None)]
+
+    def test_matches_is_field_editable(self):
+        for table_name, roles in EDITABLE_FIELDS.items():
+            columns = self._columns(table_name)
+            rows = self._rows(columns)
+            for role in list(roles) + ["unknown_role"]:
+                for project in PROJECTS:
+                    for user_emp_id in ("E100", None):
+                        matrix = PermissionMatrix(columns, role, table_name, project, user_emp_id)
+                        masks = matrix.row_masks(rows)
+                        for row, mask in zip(rows, masks):
+                            self.assertEqual(mask, matrix.row_mask(row))
+                            row_data = dict(zip(columns, row))
+                            for col, field_name in enumerate(columns):
+                                expected = is_field_editable(
+                                    role, field_name, row_data, user_emp_id, project, table_name)
+                                self.assertEqual(
+                                    bool(mask >> col & 1), expected,
+                                    (table_name, role, project, user_emp_id, row[0], field_name))
+
+    def test_missing_leader_column_is_never_editable(self):
+        table_name = '"public"."production_inputs"'
+        role = "rfdb_production_leaders"
+        columns = ["s_no", "rfdb_production_status"]
+        matrix = PermissionMatrix(columns, role, table_name, "rfdb_project", "E100")
+        self.assertTrue(matrix.restricted)
+        self.assertEqual(matrix.row_mask(("1", "WIP")), 0)
+        self.assertEqual(matrix.row_masks([("1", "WIP")]), [0])
+
+    def test_grand_leaders_unrestricted(self):
+        for table_name, roles in EDITABLE_FIELDS.items():
+            if "grand_leaders" not in roles:
+                continue
+            columns = self._columns(table_name)
+            matrix = PermissionMatrix(columns, "grand_leaders", table_name, "rfdb_project", "E100")
+            self.assertFalse(matrix.restricted)
+            self.assertEqual(matrix.row_masks(self._rows(columns)), [matrix.column_mask] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# coding=utf-8
+"""PortalTableModel tests (needs PyQt5, not QGIS)."""
+
+import unittest
+
+try:
+    from PyQt5.QtCore import Qt
+    from ..portal_table_model import PortalTableModel
+except ImportError:
+    PortalTableModel = None
+
+COLUMNS = ["s_no", "status", "emp_id"]
+ROWS = [
+    (3, "WIP", 101),
+    (1, "Done", None),
+    (2, None, 102),
+]
+
+
+@unittest.skipIf(PortalTableModel is None, "PyQt5 is not available")
+class PortalTableModelTest(unittest.TestCase):
+    """Columnar storage, key lookups and streaming appends."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.model = PortalTableModel(COLUMNS)
+        self.model.set_column_types({"s_no": "integer", "status": "text", "emp_id": "integer"})
+        self.model.load(ROWS)
+
+    def column(self, name):
+        col = self.model.column_of(name)
+        return [self.model.value(row, col) for row in range(self.model.rowCount())]
+
+    def test_load(self):
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 3)
+        self.assertEqual(self.column("s_no"), [3, 1, 2])
+        self.assertEqual(self.model.data(self.model.index(1, 2)), "")
+        self.assertEqual(self.model.data(self.model.index(0, 2)), "101")
+        self.assertEqual(self.model.row_dict(0), {"s_no": 3, "status": "WIP", "emp_id": 101})
+
+    def test_key_lookup(self):
+        self.assertEqual(self.model.row_for_key(1), 1)
+        self.assertEqual(self.model.row_for_key("2"), 2)
+        self.assertEqual(self.model.row_for_key(9), -1)
+        self.assertEqual(self.model.keys(), {"1", "2", "3"})
+        self.assertEqual(self.model.column_of("missing"), -1)
+
+    def test_append_rows(self):
+        self.model.append_rows([(4, "WIP", 103)])
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertEqual(self.model.row_for_key(4), 3)
+        self.assertEqual(self.model.text(3, 2), "103")
+
+    def test_set_value_converts_text(self):
+        self.model.set_value(0, self.model.column_of("emp_id"), "205")
+        self.assertEqual(self.model.value(0, 2), 205)
+        self.model.set_value(0, self.model.column_of("emp_id"), "")
+        self.assertIsNone(self.model.value(0, 2))
+
+    def test_filter_index_follows_appends(self):
+        index = self.model.filter_index
+        self.assertEqual(index.counts(1), {"WIP": 1, "Done": 1, "": 1})
+        self.model.append_rows([(4, "WIP", 103)])
+        self.assertEqual(index.counts(1), {"WIP": 2, "Done": 1, "": 1})
+
+    def test_sort_nulls_last(self):
+        self.model.sort(self.model.column_of("status"), Qt.AscendingOrder)
+        self.assertEqual(self.column("status"), ["Done", "WIP", None])
+        self.model.sort(self.model.column_of("status"), Qt.DescendingOrder)
+        self.assertEqual(self.column("status"), ["WIP", "Done", None])
+
+    def test_sort_is_numeric_and_keeps_key_lookup(self):
+        self.model.append_rows([(10, "WIP", 104)])
+        self.model.sort(self.model.column_of("s_no"), Qt.AscendingOrder)
+        self.assertEqual(self.column("s_no"), [1, 2, 3, 10])
+        self.assertEqual(self.model.row_for_key(10), 3)
+        self.assertEqual(self.model.sort_columns, [(0, Qt.AscendingOrder)])
+
+    def test_multi_column_sort(self):
+        self.model.append_rows([(4, "WIP", 100)])
+        self.model.sort_by([(self.model.column_of("status"), Qt.DescendingOrder),
+                            (self.model.column_of("emp_id"), Qt.AscendingOrder)])
+        self.assertEqual(self.column("s_no"), [4, 3, 1, 2])
+
+    def test_sort_ignores_unknown_columns(self):
+        self.model.sort(99)
+        self.model.sort_by([])
+        self.assertEqual(self.column("s_no"), [3, 1, 2])
+
+    def test_set_data_converts_and_emits(self):
+        edited = []
+        self.model.cellEdited.connect(lambda row, col: edited.append((row, col)))
+        self.assertTrue(self.model.setData(self.model.index(0, 2), "250"))
+        self.assertEqual(self.model.value(0, 2), 250)
+        self.assertEqual(edited, [(0, 2)])
+        # Same value again: no change, no signal
+        self.assertFalse(self.model.setData(self.model.index(0, 2), "250"))
+        self.assertEqual(edited, [(0, 2)])
+
+    def test_set_data_rejects_invalid_input(self):
+        rejected, edited = [], []
+        self.model.editRejected.connect(lambda column, message: rejected.append(column))
+        self.model.cellEdited.connect(lambda row, col: edited.append((row, col)))
+        with self.assertLogs(level="WARNING"):
+            self.assertFalse(self.model.setData(self.model.index(0, 2), "abc"))
+        self.assertEqual(rejected, ["emp_id"])
+        self.assertEqual(edited, [])
+        self.assertEqual(self.model.value(0, 2), 101)
+
+    def test_merge_rows_updates_and_appends(self):
+        updated, added = self.model.merge_rows([(1, "WIP", 105), (7, "Done", 106)])
+        self.assertEqual((updated, added), (1, 1))
+        self.assertEqual(self.model.row_dict(self.model.row_for_key(1)), {"s_no": 1, "status": "WIP", "emp_id": 105})
+        self.assertEqual(self.model.row_for_key(7), 3)
+        self.assertEqual(self.model.filter_index.counts(1), {"WIP": 2, "Done": 1, "": 1})
+
+    def test_remove_keys(self):
+        self.model.sort(self.model.column_of("s_no"), Qt.AscendingOrder)
+        self.model.filter_index.postings(1)
+        self.assertEqual(self.model.remove_keys({"2", "9"}), 1)
+        self.assertEqual(self.model.remove_keys(set()), 0)
+        self.assertEqual(self.column("s_no"), [1, 3])
+        self.assertEqual(self.model.keys(), {"1", "3"})
+        self.assertEqual(self.model.row_for_key(3), 1)
+        # The index was renumbered, not rebuilt, and still matches the data
+        self.assertEqual(self.model.filter_index.counts(1), {"Done": 1, "WIP": 1})
+        self.model.append_rows([(5, None, 107)])
+        self.assertEqual(self.model.row_for_key(5), 2)
+        self.assertEqual(self.model.filter_index.counts(1), {"Done": 1, "WIP": 1, "": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,6 +125,16 @@ class UserLoginViewer:
             enabled_flag=True
         )
 
+        # Menu only: installs the database change-notification triggers (needs table owner rights)
+        self.install_triggers_action = self.add_action(
+            icon_path,
+            text=self.tr(u'Install change notification triggers'),
+            callback=self.install_change_triggers,
+            parent=self.iface.mainWindow(),
+            enabled_flag=True,
+            add_to_toolbar=False
+        )
+
         self.login_dialog.portal_viewer_enable.connect(self.work_allocation_viewer_action.setEnabled)
 
         #No submenu implementation
@@ -281,6 +291,9 @@ class UserLoginViewer:
         def on_attr_changed(fid, idx, value):
             if getattr(self, '_reverting_attr', False):
                 return
+            # Names written by the batched emp_id name fill are not user edits
+            if getattr(self.login_dialog, '_filling_names', False):
+                return
 
             try:
                 field_name = layer.fields()[idx].name()
@@ -329,14 +342,20 @@ class UserLoginViewer:
             except Exception as e:
                 print(f"Error in attribute change handler: {e}")
 
-        try:
-            layer.attributeValueChanged.disconnect()
-        except Exception:
-            pass
+        # Only replace our own previous handler; other slots (e.g. the name fill) stay connected
+        previous = getattr(self, '_attr_changed_slot', None)
+        if previous is not None:
+            try:
+                previous[0].attributeValueChanged.disconnect(previous[1])
+            except Exception:
+                pass
         try:
             layer.attributeValueChanged.connect(on_attr_changed)
+            self._attr_changed_slot = (layer, on_attr_changed)
         except Exception as e:
             print(f"Error connecting attributeValueChanged: {e}")
+        # The layer may be new (state reload): make sure the emp_id -> name fill follows it
+        self.login_dialog.connect_name_fill(layer)
 
     def sort_attribute_table_by_sno(self):
         """Sort the attribute table by s_no column for the plugin's loaded vector layer."""
@@ -522,6 +541,29 @@ class UserLoginViewer:
         self.work_allocation_dialog = WorkAllocationPortalViewerDialog(self.db_handler, user_role, table_name, parent=self.iface.mainWindow())
         self.work_allocation_dialog.show()
 
+    def install_change_triggers(self):
+        """Install sql/change_notify_triggers.sql so every edit reaches open portals."""
+        if not self.is_logged_in or getattr(self, "db_handler", None) is None:
+            QMessageBox.warning(None, "Access Denied", "You must log in to install the change notification triggers.")
+            return
+        reply = QMessageBox.question(
+            self.iface.mainWindow(), "Install Change Notifications",
+            "Install database triggers that announce every change to production_inputs and "
+            "tm_production_inputs to open portals?\nThis needs owner rights on both tables.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        try:
+            self.db_handler.install_change_triggers()
+        except Exception as e:
+            QMessageBox.critical(self.iface.mainWindow(), "Install Error", f"Failed to install triggers:\n{e}")
+            return
+        QMessageBox.information(
+            self.iface.mainWindow(), "Install Change Notifications",
+            "Change notification triggers installed. Portals opened from now on rely on them."
+        )
+
     def show_select_state_dialog(self):
         try:
             subcountries = self.db_handler.fetch_unique_subcountries('"public"."tm_production_inputs"')
@@ -1,50 +1,42 @@
 from PyQt5.QtWidgets import (
-    QDialog, QTableWidgetItem, QMessageBox, QStyledItemDelegate, QUndoStack, QUndoCommand
+    QDialog, QMessageBox, QStyledItemDelegate, QUndoStack, QUndoCommand
 )
 from PyQt5.QtWidgets import QStyledItemDelegate, QComboBox
-from PyQt5.QtGui import QIcon, QColor
-from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QEvent, QItemSelection, QItemSelectionModel, QTimer
 import os
+from psycopg2.extras import execute_values
 from PyQt5 import QtWidgets
 from PyQt5 import uic
 from .work_allocation_portal_viewer import Ui_Dialog
-from .conflict_listener import PostgresListener, is_field_editable
+from .conflict_listener import NotificationHub
+from .portal_table_model import PortalTableModel, to_text
+from .filter_engine import bitset, iter_bits
+from .filter_list_model import FilterValueListModel, FilterValueProxyModel, CheckableListView
+from .permissions import PermissionMatrix
+from .employee_directory import EmployeeDirectory, EMPLOYEE_CHANGE_CHANNEL
+from .async_db import AsyncDbExecutor
+from .notify_payload import encode_changes, decode_payload, notify_channel
+from .db_handler import SCHEMA_CHANGE_CHANNEL
 import inspect
-from PyQt5.QtWidgets import QApplication, QTableWidgetItem
+import logging
+import uuid
+from datetime import timedelta
+from PyQt5.QtWidgets import QApplication
 from .db_handler import signal_bus
 from qgis.core import QgsProject
 from qgis.utils import iface
 from qgis.core import QgsProject, QgsRectangle, QgsCoordinateTransform
-#from .constants import EMP_ID_TO_NAME_FIELDS
 from .constants import (
-    EDITABLE_FIELDS,
+    EDITABLE_FIELDS, EMP_ID_TO_NAME_FIELD,
     INTERSECTION_TYPE_VALUES, TURN_MANEUVER_EXTRACTION_TYPE_VALUES,
     RFDB_PRODUCTION_STATUS_VALUES, RFDB_QC_STATUS_VALUES,
     SILOC_STATUS_VALUES, DELIVERY_STATUS_VALUES, DATE_COLUMNS
 )
 from .form_features import UndoRedoDelegate, ComboBoxDelegate, DateDelegate
 
+logger = logging.getLogger(__name__)
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    def __init__(self, value):
-        super().__init__(str(value))
-        self.value = value
-    def __lt__(self, other):
-        try:
-            return float(self.value) < float(other.value)
-        except Exception:
-            return str(self.value) < str(other.value)
-
-class DateTableWidgetItem(QTableWidgetItem):
-    def __init__(self, value):
-        super().__init__(str(value))
-        self.value = value
-    def __lt__(self, other):
-        try:
-            from dateutil.parser import parse
-            return parse(self.value) < parse(other.value)
-        except Exception:
-            return str(self.value) < str(other.value)
 
 class CellEditCommand(QUndoCommand):
     def __init__(self, dialog, s_no, col_name, old_value, new_value):
@@ -55,137 +47,176 @@ class CellEditCommand(QUndoCommand):
         self.old_value = old_value
         self.new_value = new_value
 
-    def _find_row_col(self):
-        s_no_idx = self.dialog.columns.index("s_no")
-        col_idx = self.dialog.columns.index(self.col_name)
-        for row in range(self.dialog.ui.tableWidget.rowCount()):
-            s_no_item = self.dialog.ui.tableWidget.item(row, s_no_idx)
-            if s_no_item and s_no_item.text() == self.s_no:
-                return row, col_idx
-        return None, None
-
     def undo(self):
         #print(f"[UNDO] Cell ({self.s_no}, {self.col_name}) reverting to '{self.old_value}'")
         self.dialog._is_undo_redo = True
-        row, col = self._find_row_col()
+        row, col = self.dialog.find_cell(self.s_no, self.col_name)
         if row is not None and col is not None:
-            item = self.dialog.ui.tableWidget.item(row, col)
-            if item:
-                self.dialog.ui.tableWidget.blockSignals(True)
-                item.setText("" if self.old_value is None else str(self.old_value))
-                self.dialog.ui.tableWidget.blockSignals(False)
-                self.dialog.handle_cell_changed(row, col)
+            self.dialog.model.set_value(row, col, self.old_value)
+            self.dialog.handle_cell_changed(row, col)
         self.dialog._is_undo_redo = False
 
     def redo(self):
         self.dialog._is_undo_redo = True
-        row, col = self._find_row_col()
+        row, col = self.dialog.find_cell(self.s_no, self.col_name)
         if row is not None and col is not None:
-            item = self.dialog.ui.tableWidget.item(row, col)
-            if item:
-                self.dialog.ui.tableWidget.blockSignals(True)
-                item.setText("" if self.new_value is None else str(self.new_value))  # <-- use new_value
-                self.dialog.ui.tableWidget.blockSignals(False)
-                self.dialog.handle_cell_changed(row, col)
-                # Force cache update
-                self.dialog._cell_prev_values[(self.s_no, self.col_name)] = self.new_value  # <-- use new_value
+            self.dialog.model.set_value(row, col, self.new_value)  # <-- use new_value
+            self.dialog.handle_cell_changed(row, col)
+            # Force cache update
+            self.dialog._cell_prev_values[(self.s_no, self.col_name)] = self.new_value  # <-- use new_value
         self.dialog._is_undo_redo = False
 
 class GroupEditCommand(QUndoCommand):
-    def __init__(self, dialog, edits):
-        super().__init__("Group Paste")
+    def __init__(self, dialog, edits, text="Group Paste"):
+        super().__init__(text)
         self.dialog = dialog
-        self.edits = edits  # List of (row, col, old_value, new_value)
+        self.edits = edits  # List of (s_no, col_name, old_value, new_value)
 
-    def _find_row_col(self, s_no, col_name):
-        s_no_idx = self.dialog.columns.index("s_no")
-        col_idx = self.dialog.columns.index(col_name)
-        for row in range(self.dialog.ui.tableWidget.rowCount()):
-            s_no_item = self.dialog.ui.tableWidget.item(row, s_no_idx)
-            if s_no_item and s_no_item.text() == s_no:
-                return row, col_idx
-        return None, None
+    def _apply(self, values):
+        """Set (s_no, col_name, value) cells in the model, then write them as one batch."""
+        applied = []
+        for s_no, col_name, value in values:
+            row, col = self.dialog.find_cell(s_no, col_name)
+            if row is not None and col is not None:
+                try:
+                    self.dialog.model.set_value(row, col, value)
+                except ValueError:
+                    continue
+                applied.append((s_no, col_name, self.dialog.model.value(row, col)))
+        self.dialog.write_cell_batch(applied)
 
     def undo(self):
-        self.dialog._is_undo_redo = True
-        for s_no, col_name, old_value, new_value in reversed(self.edits):
-            row, col = self._find_row_col(s_no, col_name)
-            if row is not None and col is not None:
-                item = self.dialog.ui.tableWidget.item(row, col)
-                if item:
-                    self.dialog.ui.tableWidget.blockSignals(True)
-                    item.setText("" if old_value is None else str(old_value))
-                    self.dialog.ui.tableWidget.blockSignals(False)
-                    self.dialog.handle_cell_changed(row, col)
-        self.dialog._is_undo_redo = False
+        self._apply([(s_no, col_name, old_value) for s_no, col_name, old_value, _ in reversed(self.edits)])
 
     def redo(self):
-        self.dialog._is_undo_redo = True
-        for s_no, col_name, old_value, new_value in self.edits:
-            row, col = self._find_row_col(s_no, col_name)
-            if row is not None and col is not None:
-                item = self.dialog.ui.tableWidget.item(row, col)
-                if item:
-                    self.dialog.ui.tableWidget.blockSignals(True)
-                    item.setText("" if new_value is None else str(new_value))
-                    self.dialog.ui.tableWidget.blockSignals(False)
-                    self.dialog.handle_cell_changed(row, col)
-        self.dialog._is_undo_redo = False
+        self._apply([(s_no, col_name, new_value) for s_no, col_name, _, new_value in self.edits])
 
 class FilterManager:
     """Manages per-column filtering using header ▼ icons (sorting remains enabled)."""
 
-    def __init__(self, tableWidget):
-        self.tableWidget = tableWidget
+    SEARCH_DEBOUNCE_MS = 200
+
+    def __init__(self, tableView):
+        self.tableView = tableView
         self.filter_mode_enabled = False
         self._column_filters = {}
         self.original_headers = []
-        self._filter_value_pool = {}  
+        self._hidden_rows = 0  # bitset of storage rows hidden by column filters
+        self.server_side = False  # True: filters become WHERE predicates in refresh_table
+        self.model.modelReset.connect(self._reset_hidden_rows)
+
+    @property
+    def model(self):
+        return self.tableView.model()
+
+    def _reset_hidden_rows(self):
+        # A model reset un-hides every row in the view
+        self._hidden_rows = 0
+
+    def filters_by_column(self):
+        """Current filters keyed by model column instead of header name."""
+        return {
+            self.model.column_of(col_name): allowed
+            for col_name, allowed in self._column_filters.items()
+        }
+
+    def resync_hidden_rows(self):
+        """Rebuild the hidden-row bitset from the view after rows were removed."""
+        self._hidden_rows = bitset(
+            (self.model.storage_row(row) for row in range(self.model.rowCount())
+             if self.tableView.isRowHidden(row)),
+            self.model.rowCount()
+        )
+
+    def set_server_side(self, enabled):
+        """Switch between hiding rows locally and filtering in PostgreSQL."""
+        if enabled == self.server_side:
+            return
+        self.server_side = enabled
+        if self._column_filters:
+            # Server side: reload only matching rows. Client side: reload all, then hide.
+            self.tableView.parent().refresh_table()
+
+    def sql_predicates(self, except_col_name=None):
+        """Active filters as parameterised SQL predicates: ([sql, ...], [param, ...])."""
+        predicates, params = [], []
+        for col_name, allowed in self._column_filters.items():
+            col = self.model.column_of(col_name)
+            if col < 0 or col_name == except_col_name:
+                continue
+            column = self.model.columns[col]
+            predicates.append(self._typed_predicate(column, allowed, params))
+        return predicates, params
+
+    def _typed_predicate(self, column, allowed, params):
+        """
+        `column = ANY(%s::<type>[])` (index friendly) for the selected value texts,
+        plus IS NULL when the empty value is selected. The texts are to_text() of
+        native values in both modes, and PostgreSQL parses them back by the cast.
+        """
+        dialog = self.tableView.parent()
+        cast = dialog._sql_cast(column)
+        texts = sorted(text for text in allowed if text != "")
+        parts = []
+        if texts:
+            if cast:
+                parts.append(f"{column} = ANY(%s{cast}[])")
+            else:
+                parts.append(f"{column}::text = ANY(%s)")
+            params.append(texts)
+        if "" in allowed:
+            parts.append(f"{column} IS NULL")
+            if dialog.col_types.get(column) in ("text", "character varying", "character"):
+                parts.append(f"{column} = ''")
+        return "(" + " OR ".join(parts) + ")" if parts else "FALSE"
+
+    def matching_rows(self, except_col=-1):
+        """Bitset of storage rows passing every filter except the one on `except_col`."""
+        return self.model.filter_index.matching(self.filters_by_column(), except_col)
 
     def create_filter(self):
         """Toggles filter mode by updating header text and activating section clicks."""
         # Save the current selection before toggling the filter
-        selected_cells = self.tableWidget.parent().get_selected_cells_by_id()
+        selected_cells = self.tableView.parent().get_selected_cells_by_id()
 
-        col_count = self.tableWidget.columnCount()
+        col_count = self.model.columnCount()
 
         if not self.filter_mode_enabled:
             # Store original header names
             self.original_headers = [
-                self.tableWidget.horizontalHeaderItem(i).text()
-                if self.tableWidget.horizontalHeaderItem(i) else f"Column {i}"
+                self.model.headerData(i, Qt.Horizontal) or f"Column {i}"
                 for i in range(col_count)
             ]
 
             # Add ▼ icon to header labels
             for i in range(col_count):
-                item = self.tableWidget.horizontalHeaderItem(i)
-                if item and "▼" not in item.text():
-                    item.setText(f"{item.text()} ▼")
+                text = self.model.headerData(i, Qt.Horizontal)
+                if text and "▼" not in text:
+                    self.model.setHeaderData(i, Qt.Horizontal, f"{text} ▼")
 
             # Connect header clicks to open filter dialog
-            self.tableWidget.horizontalHeader().sectionClicked.connect(self._handle_header_click)
+            self.tableView.horizontalHeader().sectionClicked.connect(self._handle_header_click)
             self.filter_mode_enabled = True
 
         else:
             # Remove filter mode: restore headers, disconnect, clear filters
             for i, orig in enumerate(self.original_headers):
-                item = self.tableWidget.horizontalHeaderItem(i)
-                if item:
-                    # Remove both ▼ and 🔽 icons from header text
-                    base = orig.replace(" ▼", "").replace("🔽", "")
-                    item.setText(base)
+                # Remove both ▼ and 🔽 icons from header text
+                base = orig.replace(" ▼", "").replace("🔽", "")
+                self.model.setHeaderData(i, Qt.Horizontal, base)
             try:
-                self.tableWidget.horizontalHeader().sectionClicked.disconnect(self._handle_header_click)
+                self.tableView.horizontalHeader().sectionClicked.disconnect(self._handle_header_click)
             except Exception:
                 pass
             self.filter_mode_enabled = False
+            had_filters = bool(self._column_filters)
             self._column_filters.clear()
-            self.apply_column_filters()
+            if had_filters:
+                self.apply_column_filters()
         self.update_header_icons()
 
         # Restore the selection after toggling the filter
-        self.tableWidget.parent().restore_selection_by_id(selected_cells)
+        self.tableView.parent().restore_selection_by_id(selected_cells)
 
     def _handle_header_click(self, index):
         """Open column filter dialog when ▼ icon header is clicked."""
@@ -194,10 +225,25 @@ class FilterManager:
 
     def open_column_filter_dialog(self, index):
         """Open the custom UI dialog for filtering values in a specific column."""
-        if index >= self.tableWidget.columnCount():
+        if index >= self.model.columnCount():
             return
 
         col_name = self.original_headers[index]
+
+        if self.server_side:
+            # --- Value pool from PostgreSQL, respecting the other columns' filters ---
+            self.tableView.parent().query_value_counts(
+                self.model.columns[index],
+                lambda counts: self._show_filter_dialog(index, col_name, counts)
+            )
+            return
+
+        # --- Value -> count among rows passing all filters except this column's ---
+        # (the index keeps these up to date through edits and NOTIFY refreshes)
+        counts = self.model.filter_index.value_counts(index, self.matching_rows(index))
+        self._show_filter_dialog(index, col_name, counts)
+
+    def _show_filter_dialog(self, index, col_name, counts):
         current_filter = self._column_filters.get(col_name, None)
 
         # Helper for robust sorting
@@ -209,29 +255,11 @@ class FilterManager:
             except (ValueError, TypeError):
                 return (2, str(val))
 
-        if col_name not in self._filter_value_pool:
-            # --- Apply all filters except the one for this column ---
-            filtered_rows = self.tableWidget.parent().get_filtered_rows_except(col_name)
-            raw_values = [
-                self.tableWidget.item(row, index).text()
-                for row in filtered_rows
-                if self.tableWidget.item(row, index)
-            ]
-            # Remove duplicates while preserving order
-            seen = set()
-            values = []
-            for v in raw_values:
-                if v not in seen:
-                    seen.add(v)
-                    values.append(v)
-            values = sorted(values, key=try_num)
-            self._filter_value_pool[col_name] = values
-        else:
-            values = self._filter_value_pool[col_name]
+        values = sorted(counts, key=try_num)
 
         # Load custom filter dialog
         ui_path = os.path.join(os.path.dirname(__file__), "custom_attribute_table_filter.ui")
-        dialog = QtWidgets.QDialog(self.tableWidget)
+        dialog = QtWidgets.QDialog(self.tableView)
         dialog.setModal(True)
         uic.loadUi(ui_path, dialog)
         dialog.setWindowTitle(f"Filter: {col_name}")
@@ -243,41 +271,35 @@ class FilterManager:
             layout.removeWidget(old_widget)
             old_widget.deleteLater()
 
-        # Add your custom CheckableListWidget
-        list_widget = self.tableWidget.parent().CheckableListWidget()
-        list_widget.setObjectName("listWidget")
-        list_widget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        # Model-backed list: rows are only materialised when the view paints them
+        value_model = FilterValueListModel(values, counts, current_filter, dialog)
+        proxy = FilterValueProxyModel(dialog)
+        proxy.setSourceModel(value_model)
+        list_view = CheckableListView()
+        list_view.setObjectName("listWidget")
+        list_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        list_view.setModel(proxy)
         if layout:
-            layout.insertWidget(1, list_widget)  # Insert after the search box
-
-        # Populate the list_widget with checkable items
-        for val in values:
-            item = QtWidgets.QListWidgetItem(val)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            if current_filter is not None:
-                item.setCheckState(Qt.Checked if val in current_filter else Qt.Unchecked)
-            else:
-                item.setCheckState(Qt.Checked)
-            list_widget.addItem(item)
+            layout.insertWidget(1, list_view)  # Insert after the search box
 
-        # Spacebar toggling is handled by your CheckableListWidget class
+        # Spacebar toggling is handled by CheckableListView
 
         # Hook up buttons
         select_all_btn = dialog.findChild(QtWidgets.QPushButton, "selectAllButton")
         clear_btn = dialog.findChild(QtWidgets.QPushButton, "clearButton")
         if select_all_btn:
-            select_all_btn.clicked.connect(lambda: [list_widget.item(i).setCheckState(Qt.Checked) for i in range(list_widget.count())])
+            select_all_btn.clicked.connect(lambda: value_model.set_all_checked(True))
         if clear_btn:
-            clear_btn.clicked.connect(lambda: [list_widget.item(i).setCheckState(Qt.Unchecked) for i in range(list_widget.count())])
+            clear_btn.clicked.connect(lambda: value_model.set_all_checked(False))
 
-        # Hook up search box
+        # Hook up search box (debounced so typing does not refilter on every key)
         search_box = dialog.findChild(QtWidgets.QLineEdit, "searchBox")
         if search_box:
-            def filter_items(text):
-                for i in range(list_widget.count()):
-                    item = list_widget.item(i)
-                    item.setHidden(text.lower() not in item.text().lower())
-            search_box.textChanged.connect(filter_items)
+            search_timer = QTimer(dialog)
+            search_timer.setSingleShot(True)
+            search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+            search_timer.timeout.connect(lambda: proxy.setFilterFixedString(search_box.text()))
+            search_box.textChanged.connect(search_timer.start)
 
         # Dialog button signals
         button_box = dialog.findChild(QtWidgets.QDialogButtonBox, "buttonBox")
@@ -286,60 +308,52 @@ class FilterManager:
             button_box.rejected.connect(dialog.reject)
 
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            checked_values = {list_widget.item(i).text() for i in range(list_widget.count()) if list_widget.item(i).checkState() == Qt.Checked}
-            if checked_values and len(checked_values) < list_widget.count():
+            checked_values = value_model.checked_values()
+            if checked_values and not value_model.all_checked():
                 self._column_filters[col_name] = checked_values
             else:
                 self._column_filters.pop(col_name, None)
-                self._filter_value_pool.pop(col_name, None)  # Remove pool if filter is cleared
             self.apply_column_filters()
 
     def apply_column_filters(self):
         """Apply the current filters to the table rows."""
+        if self.server_side:
+            # The WHERE clause does the filtering; reload with the new predicates
+            self.update_header_icons()
+            self.tableView.parent().refresh_table()
+            return
+
         # Save the current selection before filtering
-        selected_cells = self.tableWidget.parent().get_selected_cells_by_id()
+        selected_cells = self.tableView.parent().get_selected_cells_by_id()
 
-        headers = [
-            self.original_headers[i] if i < len(self.original_headers)
-            else self.tableWidget.horizontalHeaderItem(i).text().replace(" ▼", "")
-            for i in range(self.tableWidget.columnCount())
-        ]
+        index = self.model.filter_index
+        hidden = index.all_rows & ~self.matching_rows() if self._column_filters else 0
 
-        for row in range(self.tableWidget.rowCount()):
-            show_row = True
-            for col_name, allowed_values in self._column_filters.items():
-                try:
-                    col_idx = headers.index(col_name)
-                except ValueError:
-                    continue
-                item = self.tableWidget.item(row, col_idx)
-                if item is None or item.text() not in allowed_values:
-                    show_row = False
-                    break
-            self.tableWidget.setRowHidden(row, not show_row)
+        # Only rows whose visibility actually changes are touched
+        for rid in iter_bits(hidden ^ self._hidden_rows):
+            self.tableView.setRowHidden(self.model.view_row(rid), bool(hidden >> rid & 1))
+        self._hidden_rows = hidden
+        # Rows outside the "Selected Feature(s)" set stay hidden whatever the filters say
+        self.tableView.parent().apply_sno_filter()
 
-        if not self._column_filters:
-            self._filter_value_pool.clear()
         self.update_header_icons()
 
         # Restore the selection after filtering
-        self.tableWidget.parent().restore_selection_by_id(selected_cells)
+        self.tableView.parent().restore_selection_by_id(selected_cells)
             
     def update_header_icons(self):
         """Update header icons: show '▼' for normal, '🔽' for filtered columns, or plain if no filter."""
-        for i in range(self.tableWidget.columnCount()):
+        for i in range(self.model.columnCount()):
             col_name = self.original_headers[i]
-            item = self.tableWidget.horizontalHeaderItem(i)
-            if item:
-                base = col_name.replace(" ▼", "").replace("🔽", "")
-                if self.filter_mode_enabled:
-                    if col_name in self._column_filters:
-                        item.setText(f"{base} 🔽")
-                    else:
-                        item.setText(f"{base} ▼")
+            base = col_name.replace(" ▼", "").replace("🔽", "")
+            if self.filter_mode_enabled:
+                if col_name in self._column_filters:
+                    self.model.setHeaderData(i, Qt.Horizontal, f"{base} 🔽")
                 else:
-                    # Filter mode is off: show plain header (no icons)
-                    item.setText(base)
+                    self.model.setHeaderData(i, Qt.Horizontal, f"{base} ▼")
+            else:
+                # Filter mode is off: show plain header (no icons)
+                self.model.setHeaderData(i, Qt.Horizontal, base)
             
 
 class WorkAllocationPortalViewerDialog(QDialog):
@@ -387,6 +401,15 @@ class WorkAllocationPortalViewerDialog(QDialog):
         "delivery_status": DELIVERY_STATUS_VALUES,
     }
 
+    # Streaming load: size of the first page, then of each following chunk
+    STREAM_FIRST_PAGE = 500
+    STREAM_CHUNK_SIZE = 5000
+    # NOTIFY payloads arriving within this window are fetched in one query
+    NOTIFY_COALESCE_MS = 150
+    # A writer that read its clock before our max(last_updated) but committed after it
+    # stamps rows at or below the watermark; re-read this much history on each delta
+    DELTA_OVERLAP = timedelta(minutes=5)
+
     def __init__(self, db_handler, user_role, table_name, subcountry=None, emp_id=None, qgis_layer=None, parent=None):
         super().__init__(parent)
         self.db_handler = db_handler
@@ -406,9 +429,14 @@ class WorkAllocationPortalViewerDialog(QDialog):
         else:
             self.project = None
 
+        # EDITABLE_FIELDS compiled once for this table/role/user
+        self.permissions = PermissionMatrix(
+            self.columns, self.user_role, self.table_name, self.project, self.emp_id
+        )
+
         self.ui = Ui_Dialog()
         self.ui.setupUi(self)
-        #self.ui.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.EditKeyPressed | QtWidgets.QAbstractItemView.SelectedClicked)
+        #self.ui.tableView.setEditTriggers(QtWidgets.QAbstractItemView.EditKeyPressed | QtWidgets.QAbstractItemView.SelectedClicked)
 
         self.setWindowTitle("Work Allocation Portal Viewer/Editor")
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinMaxButtonsHint)
@@ -429,20 +457,63 @@ class WorkAllocationPortalViewerDialog(QDialog):
         self.ui.Zoom_to_feature.setToolTip("Zoom to Feature")
         self.ui.Create_filter.setToolTip("Filter")
 
+        # Columnar model behind the table view (no per-cell Qt items)
+        self.model = PortalTableModel(self.columns, self)
+        self.model.set_permissions(self.permissions)
+        self.ui.tableView.setModel(self.model)
+
         self.undo_stack = QUndoStack(self)
         self._cell_prev_values = {}
         self._is_undo_redo = False
         self._is_group_paste = False
-        self.delegate = UndoRedoDelegate(self.ui.tableWidget, self._cell_prev_values)
-        self.ui.tableWidget.setItemDelegate(self.delegate)
-
-        self.ui.tableWidget.installEventFilter(self)
-        self.ui.tableWidget.viewport().installEventFilter(self)
-
-        self.ui.tableWidget.setDragDropMode(self.ui.tableWidget.NoDragDrop)
-        self.ui.tableWidget.setDragEnabled(False)
-        self.ui.tableWidget.setDropIndicatorShown(False)
-        self.ui.tableWidget.setDefaultDropAction(Qt.IgnoreAction)
+        self.delegate = UndoRedoDelegate(self.ui.tableView, self._cell_prev_values)
+        self.ui.tableView.setItemDelegate(self.delegate)
+
+        self.ui.tableView.installEventFilter(self)
+        self.ui.tableView.viewport().installEventFilter(self)
+
+        self.ui.tableView.setDragDropMode(self.ui.tableView.NoDragDrop)
+        self.ui.tableView.setDragEnabled(False)
+        self.ui.tableView.setDropIndicatorShown(False)
+        self.ui.tableView.setDefaultDropAction(Qt.IgnoreAction)
+
+        # --- emp_id -> name lookups for the *_done_by columns (loaded at login) ---
+        self.employee_directory = EmployeeDirectory.for_handler(self.db_handler)
+        if self.employee_directory.is_expired():
+            self.employee_directory.reload_async()
+
+        # --- All SQL runs on worker threads with connections from the DbHandler pools ---
+        self.async_db = AsyncDbExecutor(self.db_handler, self)
+        # (s_no text, column) -> [queued writes, latest value]: cells whose write has not
+        # finished yet; server rows merged meanwhile must not overwrite them
+        self._pending_writes = {}
+
+        # --- Streaming load: server-side cursor drained chunk by chunk ---
+        self._load_task = None
+        self._sno_filter = None
+        self._has_last_updated = False
+        self._watermark = None  # max(last_updated) seen by the last full or delta load
+
+        # --- NOTIFY batching: s_no values queued until the timer fires ---
+        self._pending_notify_ids = set()
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(self.NOTIFY_COALESCE_MS)
+        self._notify_timer.timeout.connect(self._flush_notifies)
+        self.load_progress = QtWidgets.QProgressBar(self)
+        self.load_progress.setFormat("Loading %v / %m rows")
+        self.cancel_load_button = QtWidgets.QPushButton("Cancel", self)
+        self.cancel_load_button.setToolTip("Stop loading; rows already shown are kept")
+        self.cancel_load_button.clicked.connect(self.cancel_loading)
+        progress_row = QtWidgets.QHBoxLayout()
+        progress_row.addWidget(self.load_progress)
+        progress_row.addWidget(self.cancel_load_button)
+        self.server_filter_checkbox = QtWidgets.QCheckBox("Server-side filters", self)
+        self.server_filter_checkbox.setToolTip("Apply column filters in the database and load only matching rows")
+        progress_row.addStretch()
+        progress_row.addWidget(self.server_filter_checkbox)
+        self.ui.verticalLayout.addLayout(progress_row)
+        self._set_loading_visible(False)
 
         
         self.quoted_table = self.table_name
@@ -458,88 +529,101 @@ class WorkAllocationPortalViewerDialog(QDialog):
         self._suppress_invalid_empid_popup = False
         self.load_column_types()
 
+        self.filter_manager = FilterManager(self.ui.tableView)
+        self.server_filter_checkbox.toggled.connect(self.filter_manager.set_server_side)
+        # Header clicks sort while filter mode is off (Shift+click adds a sort column)
+        self.ui.tableView.horizontalHeader().sectionClicked.connect(self._on_header_sort_click)
+
         self.refresh_table()
-        self.ui.Refresh.clicked.connect(self.refresh_table)
-        self.ui.tableWidget.cellChanged.connect(self.handle_cell_changed)
+        self.ui.Refresh.clicked.connect(self.refresh_changes)
+        self.model.cellEdited.connect(self.handle_cell_changed)
+        self.model.editRejected.connect(self._on_edit_rejected)
         self.ui.Organize_columns.clicked.connect(self.organize_columns)
         self.ui.Zoom_to_feature.clicked.connect(self.zoom_to_selected_row_on_map)
         self.ui.Create_filter.clicked.connect(self.create_filter)
         self._suppress_invalid_empid_popup = False
 
-        self.filter_manager = FilterManager(self.ui.tableWidget)
-
-        # PostgreSQL listener for real-time updates
-        dsn = self.db_handler.get_dsn()
-        self.pg_listener = PostgresListener(dsn, "production_inputs_update")
-        self.pg_listener.notified.connect(self.handle_db_notify)
+        # Real-time updates through the session's shared LISTEN connection.
+        # Our own change payloads carry this id so we can skip their echo.
+        self._notify_source = uuid.uuid4().hex[:8]
+        # Each table publishes on its own channel: TM and RFDB clients never see each other's edits
+        self.notify_channel = notify_channel(self.table)
+        self.notification_hub = NotificationHub.for_handler(self.db_handler)
+        self._subscriptions = [
+            (self.notify_channel, self.handle_db_notify),
+            (SCHEMA_CHANGE_CHANNEL, self._on_schema_changed),
+            (EMPLOYEE_CHANGE_CHANNEL, self._on_employees_changed),
+        ]
+        for channel, slot in self._subscriptions:
+            self.notification_hub.subscribe(channel, slot)
+        # Notifications are lost while the hub reconnects: catch up with a delta refresh
+        self.notification_hub.reconnected.connect(self.refresh_changes)
+        # With the database triggers installed (sql/change_notify_triggers.sql) every
+        # write is announced server-side, so we stop sending our own NOTIFY
+        self._db_publishes_changes = False
+        self.async_db.run(
+            lambda conn: self.db_handler.has_change_triggers(self.schema, self.table, conn),
+            on_result=self._set_db_publishes_changes,
+            on_error=lambda message: logger.warning("Change trigger check failed: %s", message)
+        )
+        self.finished.connect(self._unsubscribe_notifications)
 
         self.combo_delegates = {}
         for col_idx, field_name in enumerate(self.columns):
             if field_name in self.DROPDOWN_COLUMNS:
-                delegate = ComboBoxDelegate(self.DROPDOWN_COLUMNS[field_name], self.ui.tableWidget)
-                self.ui.tableWidget.setItemDelegateForColumn(col_idx, delegate)
+                delegate = ComboBoxDelegate(self.DROPDOWN_COLUMNS[field_name], self.ui.tableView)
+                self.ui.tableView.setItemDelegateForColumn(col_idx, delegate)
                 self.combo_delegates[field_name] = delegate
 
         # Date columns (add this block)
-        date_delegate = DateDelegate(self.ui.tableWidget)
+        date_delegate = DateDelegate(self.ui.tableView)
         for col_idx, field_name in enumerate(self.columns):
             if field_name in DATE_COLUMNS:
-                self.ui.tableWidget.setItemDelegateForColumn(col_idx, date_delegate)
+                self.ui.tableView.setItemDelegateForColumn(col_idx, date_delegate)
 
     def create_filter(self):
         """Toggles the filter UI."""
         self.filter_manager.create_filter()
 
+    def _selected_indexes(self):
+        """Return the selected model indexes of visible cells."""
+        view = self.ui.tableView
+        return [
+            index for index in view.selectionModel().selectedIndexes()
+            if not view.isRowHidden(index.row()) and not view.isColumnHidden(index.column())
+        ]
+
     def get_selected_cells_by_id(self):
         """Return a list of (s_no, col_name) for all selected cells."""
         selected = []
         s_no_idx = self.columns.index("s_no")
-        for item in self.ui.tableWidget.selectedItems():
-            row = item.row()
-            col = item.column()
-            s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-            if s_no_item:
-                s_no = s_no_item.text()
-                col_name = self.columns[col]
+        for index in self._selected_indexes():
+            s_no = self.model.value(index.row(), s_no_idx)
+            if s_no:
+                col_name = self.columns[index.column()]
                 selected.append((s_no, col_name))
         #print(f"[DEBUG] Selected cells: {selected}")  # Debug line
         return selected
 
     def get_selected_cell_values(self):
-        """Return a list of (s_no, col_name, value) for all selected cells."""
+        """Return a list of (s_no, col_name, text) for all selected cells."""
         selected = []
         s_no_idx = self.columns.index("s_no")
-        for item in self.ui.tableWidget.selectedItems():
-            row = item.row()
-            col = item.column()
-            s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-            if s_no_item:
-                s_no = s_no_item.text()
+        for index in self._selected_indexes():
+            row = index.row()
+            col = index.column()
+            s_no = self.model.value(row, s_no_idx)
+            if s_no:
                 col_name = self.columns[col]
-                value = item.text() if item else ""
+                value = self.model.text(row, col)
                 selected.append((s_no, col_name, value))
         #print(f"[DEBUG] Selected cell values: {selected}")  # Debug line
         return selected
 
     def get_filtered_rows_except(self, exclude_col_name):
-        headers = self.columns  # Use original column names
-        filtered_rows = []
-        for row in range(self.ui.tableWidget.rowCount()):
-            match = True
-            for col_name, allowed_values in self.filter_manager._column_filters.items():
-                if col_name == exclude_col_name:
-                    continue
-                try:
-                    col_idx = headers.index(col_name)
-                except ValueError:
-                    continue  # Skip if column not found
-                item = self.ui.tableWidget.item(row, col_idx)
-                if item is None or item.text() not in allowed_values:
-                    match = False
-                    break
-            if match:
-                filtered_rows.append(row)
-        return filtered_rows
+        """View rows passing every column filter except the one on exclude_col_name."""
+        rows = self.filter_manager.matching_rows(self.model.column_of(exclude_col_name))
+        return [self.model.view_row(rid) for rid in iter_bits(rows)]
 
     def refresh_table(self):
         if not self.columns:
@@ -550,160 +634,340 @@ class WorkAllocationPortalViewerDialog(QDialog):
         # print("[DEBUG] Refresh Triggered by stack:")                         #[DEBUG]
         # for frame in stack[1:4]:  # Show up to 3 levels above                #[DEBUG]
         #     print(f"  called by: {frame.function} (line {frame.lineno})")    #[DEBUG]
-        self.ui.tableWidget.blockSignals(True)
-        self.ui.tableWidget.setSortingEnabled(False)
-        self.ui.tableWidget.horizontalHeader().setSectionsClickable(True)
-
-        cur = self.db_handler.conn.cursor()
-
-        # Fetch column types (unchanged)
-        format_str = ','.join(['%s'] * len(self.columns))
-        query = f"""
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-            AND column_name IN ({format_str})
-            ORDER BY ordinal_position
-        """
-        params = [self.schema, self.table] + self.columns
-        cur.execute(query, params)
-        column_info = cur.fetchall()
-        self.col_types = {name: dtype for name, dtype in column_info}
+        self.cancel_loading()
+        self.ui.tableView.setSortingEnabled(False)
+        self.ui.tableView.horizontalHeader().setSectionsClickable(True)
 
-        # Fetch actual data, filtered by subcountry if set
-        if self.subcountry and self.subcountry != "All subcountry":
-            sql = f"SELECT {', '.join(self.columns)} FROM {self.quoted_table} WHERE subcountry = %s ORDER BY s_no"
-            cur.execute(sql, (self.subcountry,))
-        else:
-            sql = f"SELECT {', '.join(self.columns)} FROM {self.quoted_table} ORDER BY s_no"
-            cur.execute(sql)
-        data = cur.fetchall()
-        cur.close()
-
-        columns = self.columns
-
-        self.ui.tableWidget.setColumnCount(len(columns))
-        self.ui.tableWidget.setHorizontalHeaderLabels(columns)
-        self.ui.tableWidget.setRowCount(0)
-        self.ui.tableWidget.setRowCount(len(data))
-
-        for row_idx, row in enumerate(data):
-            # Build a dict of column_name: value for this row
-            row_data = {self.columns[c]: row[c] for c in range(len(self.columns))}
-            for col_idx, value in enumerate(row):
-                field_name = columns[col_idx]
-                dtype = self.col_types.get(field_name, "text")
-
-                if field_name == "s_no":
-                    item = NumericTableWidgetItem(value)
-                elif dtype in ("integer", "numeric", "double precision"):
-                    item = NumericTableWidgetItem(value)
-                elif dtype in ("date", "timestamp without time zone"):
-                    item = DateTableWidgetItem(value)
-                else:
-                    item = QTableWidgetItem("" if value is None else str(value))
-
-                # Row/column-wise editability check
-                if not is_field_editable(
-                        self.user_role,
-                        field_name,
-                        row_data,
-                        getattr(self, "emp_id", None),
-                        project=getattr(self, "project", None),
-                        table_name=self.table_name  # <-- pass the table name!
-                    ):
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    item.setBackground(QColor(180, 180, 180))  # Gray out
-
-                self.ui.tableWidget.setItem(row_idx, col_idx, item)
+        where, params = self._where_clause()
+
+        self.model.load([])
 
         for col_name in ("geom", "last_updated"):
             if col_name in self.columns:
                 idx = self.columns.index(col_name)
-                self.ui.tableWidget.setColumnHidden(idx, True)
+                self.ui.tableView.setColumnHidden(idx, True)
+
+        self.ui.tableView.setSortingEnabled(False)
+        self.ui.tableView.horizontalHeader().setSectionsClickable(True)
+
+        # Busy indicator until the row count is known
+        self.load_progress.setRange(0, 0)
+        self._set_loading_visible(True)
+
+        self._watermark = None
+
+        def query_load_info(conn):
+            col_types = self._query_column_types(conn)
+            has_last_updated = "last_updated" in self.db_handler.get_table_schema(self.schema, self.table, conn).types
+            with conn.cursor() as cur:
+                # Watermark is read before streaming, so later edits are re-fetched by delta refresh
+                watermark = None
+                if has_last_updated:
+                    cur.execute(f"SELECT max(last_updated) FROM {self.quoted_table}{where}", params)
+                    watermark = cur.fetchone()[0]
+                cur.execute(f"SELECT count(*) FROM {self.quoted_table}{where}", params)
+                return col_types, cur.fetchone()[0], has_last_updated, watermark
+
+        task = self.async_db.run(
+            query_load_info,
+            on_result=lambda info: self._start_stream(task, info, where, params),
+            on_error=lambda message: self._on_load_error(task, message)
+        )
+        self._load_task = task
+
+    def refresh_changes(self):
+        """
+        Refresh button: merge rows changed since the last_updated watermark (minus
+        DELTA_OVERLAP, merged idempotently by s_no) and drop rows deleted on the
+        server, keeping scroll position, selection, sort and filters. Falls back
+        to a full refresh_table() when no watermark is known.
+        """
+        if (self._load_task is not None or not self._has_last_updated
+                or self._watermark is None or self.model.rowCount() == 0):
+            self.refresh_table()
+            return
+
+        where, params = self._where_clause()
+        changed_where = f"{where} AND last_updated > %s" if where else " WHERE last_updated > %s"
+        since = self._watermark - self.DELTA_OVERLAP
+
+        def fetch_delta(conn):
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT max(last_updated) FROM {self.quoted_table}{where}", params)
+                new_watermark = cur.fetchone()[0]
+                cur.execute(
+                    f"SELECT {', '.join(self.columns)} FROM {self.quoted_table}{changed_where}",
+                    params + (since,)
+                )
+                changed = cur.fetchall()
+                # Deletions: s_no values we hold that the server no longer returns
+                cur.execute(f"SELECT s_no FROM {self.quoted_table}{where}", params)
+                live = {str(row[0]) for row in cur.fetchall()}
+            return new_watermark, changed, live
+
+        self.async_db.run(
+            fetch_delta,
+            on_result=self._apply_delta,
+            on_error=lambda message: self._on_load_error(None, message)
+        )
+
+    def _apply_delta(self, delta):
+        if self._load_task is not None:
+            return  # a full reload started meanwhile
+        new_watermark, changed, live = delta
+        updated, added = self.model.merge_rows(changed)
+        self._restore_pending_writes()
+        # merge_rows appends new rows at the end; hide them before any sort moves them
+        self.apply_sno_filter(range(self.model.rowCount() - added, self.model.rowCount()))
+        removed = self.model.remove_keys(self.model.keys() - live)
+        if new_watermark is not None:
+            self._watermark = new_watermark
+        logger.debug("Delta refresh: %d updated, %d added, %d removed", updated, added, removed)
+        if removed:
+            self.filter_manager.resync_hidden_rows()
+        if added and self.model.sort_columns:
+            self.model.sort_by(self.model.sort_columns)
+        if self.filter_manager._column_filters and not self.filter_manager.server_side:
+            self.filter_manager.apply_column_filters()
+
+    def _where_clause(self, except_col_name=None):
+        """WHERE for loads: subcountry, plus the column filters in server-side mode."""
+        predicates, params = [], []
+        # Filter by subcountry if set
+        if self._subcountry_filter():
+            predicates.append("subcountry = %s")
+            params.append(self.subcountry)
+        if self.filter_manager.server_side:
+            filter_sql, filter_params = self.filter_manager.sql_predicates(except_col_name)
+            predicates += filter_sql
+            params += filter_params
+        if not predicates:
+            return "", ()
+        return " WHERE " + " AND ".join(predicates), tuple(params)
+
+    def query_value_counts(self, column, on_result):
+        """
+        Server-side value pool: {text value: count} for column, off the GUI thread.
+        Native values are turned into text with to_text(), exactly like the
+        client-side pool, so a filter keeps matching when the mode is switched.
+        """
+        where, params = self._where_clause(except_col_name=column)
 
-        self.ui.tableWidget.setVerticalHeaderLabels([str(i + 1) for i in range(len(data))])
-        self.ui.tableWidget.blockSignals(False)
-        self.ui.tableWidget.setSortingEnabled(False)
-        self.ui.tableWidget.horizontalHeader().setSectionsClickable(True)
+        def fetch(conn):
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {column}, count(*) FROM {self.quoted_table}{where} GROUP BY 1",
+                    params
+                )
+                counts = {}
+                for value, count in cur.fetchall():
+                    text = to_text(value)  # NULL and '' both show as the empty value
+                    counts[text] = counts.get(text, 0) + count
+                return counts
+
+        self.async_db.run(
+            fetch,
+            on_result=on_result,
+            on_error=lambda message: QMessageBox.critical(self, "Filter Error", f"Failed to load values: {message}")
+        )
+
+    def _start_stream(self, info_task, info, where, params):
+        """Second load step: stream the rows through a named (server-side) cursor."""
+        if info_task is not self._load_task:
+            return
+        col_types, total, self._has_last_updated, self._watermark = info
+        self.col_types = col_types
+        self.model.set_column_types(col_types)
+        self.load_progress.setRange(0, total)
+        self.load_progress.setValue(0)
+
+        sql = f"SELECT {', '.join(self.columns)} FROM {self.quoted_table}{where} ORDER BY s_no"
+        task = self.async_db.stream(
+            sql, params, self.STREAM_CHUNK_SIZE,
+            on_chunk=lambda rows: self._on_stream_chunk(task, rows),
+            on_done=lambda loaded: self._on_stream_done(task),
+            on_error=lambda message: self._on_load_error(task, message),
+            first_chunk=self.STREAM_FIRST_PAGE
+        )
+        self._load_task = task
+
+    def _on_stream_chunk(self, task, rows):
+        if task is not self._load_task:
+            return
+        first = self.model.rowCount()
+        self.model.append_rows(rows)
+        self.load_progress.setValue(self.model.rowCount())
+        self.apply_sno_filter(range(first, self.model.rowCount()))
+
+    def apply_sno_filter(self, rows=None):
+        """Hide `rows` (default: all) whose s_no is outside filter_to_snos()' set."""
+        if self._sno_filter is None:
+            return
+        s_no_idx = self.columns.index("s_no")
+        for row in range(self.model.rowCount()) if rows is None else rows:
+            if self.model.text(row, s_no_idx) not in self._sno_filter:
+                self.ui.tableView.setRowHidden(row, True)
+
+    def _on_stream_done(self, task):
+        if task is not self._load_task:
+            return
+        self._load_task = None
+        self._set_loading_visible(False)
+        if self.filter_manager._column_filters and not self.filter_manager.server_side:
+            self.filter_manager.apply_column_filters()
+
+    def _on_load_error(self, task, message):
+        if task is not self._load_task:
+            return
+        self._load_task = None
+        self._set_loading_visible(False)
+        QMessageBox.critical(self, "Load Error", f"Failed to load rows: {message}")
+
+    def cancel_loading(self):
+        """Stop a streaming load; rows already appended stay in the table."""
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self._set_loading_visible(False)
+
+    def _set_loading_visible(self, visible):
+        self.load_progress.setVisible(visible)
+        self.cancel_load_button.setVisible(visible)
 
     def handle_db_notify(self, payload):
         """
-        Update only the affected rows in the table when a NOTIFY is received.
-        The payload is expected to be a comma‑separated string of primary keys (s_no).
-        For each s_no, the entire row (all columns in self.columns) is fetched from the DB
-        and the corresponding table row is updated.
+        Apply a NOTIFY payload (see notify_payload). Changed values are patched
+        into the model directly; id-only rows are queued, and ids arriving within
+        NOTIFY_COALESCE_MS are fetched together by _flush_notifies.
         """
-        # Split payload assuming comma-separated s_no values.
-        updated_ids = [id.strip() for id in str(payload).split(",") if id.strip()]
+        change = decode_payload(payload)
+        if change["src"] == self._notify_source:
+            return  # echo of our own write; the model already has these values
+        if change["table"] not in (None, f"{self.schema}.{self.table}"):
+            return
+        if change["sub"] is not None and self._subcountry_filter() not in (None, change["sub"]):
+            return  # rows of a subcountry this dialog has not loaded
+        removed_ids = list(change["deleted"])
+        updated_ids = list(change["ids"])
+        subcountry_filter = self._subcountry_filter()
+        for s_no, values in change["rows"].items():
+            if "subcountry" in values:
+                # Row moved between subcountries (such payloads carry no "sub")
+                if subcountry_filter is not None and values["subcountry"] != subcountry_filter:
+                    removed_ids.append(s_no)  # moved out of this dialog
+                else:
+                    updated_ids.append(s_no)  # may have moved in: re-fetch through _where_clause()
+                continue
+            if not self._patch_row(s_no, values):
+                updated_ids.append(s_no)
+        if change["rows"]:
+            self._restore_pending_writes()
+        if removed_ids and self.model.remove_keys(removed_ids):
+            self.filter_manager.resync_hidden_rows()
         if not updated_ids:
             return
+        self._pending_notify_ids.update(updated_ids)
+        if not self._notify_timer.isActive():
+            self._notify_timer.start()
+
+    def _patch_row(self, s_no, values):
+        """Write {column: value} from a change payload into the loaded row; False to re-fetch."""
+        row = self.model.row_for_key(s_no)
+        # With server-side filters a change to a filtered column can move the row
+        # into or out of the loaded set: re-fetch it through _where_clause()
+        filters = self.filter_manager._column_filters if self.filter_manager.server_side else {}
+        refilter = any(col_name in filters for col_name in values)
+        if row < 0:
+            return not refilter  # not loaded here: nothing to update unless it may match now
+        try:
+            for col_name, value in values.items():
+                col = self.model.column_of(col_name)
+                if col >= 0:
+                    self.model.set_value(row, col, value)
+        except ValueError:
+            return False
+        return not refilter
 
-        for updated_s_no in updated_ids:
-            try:
-                cur = self.db_handler.conn.cursor()
+    def _flush_notifies(self):
+        """Fetch every queued s_no with a single ANY(%s) query on a worker thread."""
+        if not self._pending_notify_ids:
+            return
+        ids = [str(s_no) for s_no in self._pending_notify_ids]
+        self._pending_notify_ids = set()
+        # Same scope as the loaded rows, so inserted rows can be added directly
+        where, params = self._where_clause()
+        where = f"{where} AND" if where else " WHERE"
+
+        def fetch_rows(conn):
+            # ids travel as text and are cast to the s_no type, like write_cell_batch
+            s_no_cast = self._sql_cast("s_no", self.db_handler.get_table_schema(self.schema, self.table, conn))
+            with conn.cursor() as cur:
                 cur.execute(
-                    f"SELECT {', '.join(self.columns)} FROM {self.quoted_table} WHERE s_no = %s",
-                    (updated_s_no,)
+                    f"SELECT {', '.join(self.columns)} FROM {self.quoted_table}{where} "
+                    f"s_no = ANY(%s::text[]{s_no_cast and s_no_cast + '[]'})",
+                    params + (ids,)
                 )
-                row_data = cur.fetchone()
-                cur.close()
-                if not row_data:
-                    continue  # No record found for this s_no
-            except Exception as e:
-                print(f"[DEBUG] Error fetching update for s_no {updated_s_no}: {e}")
-                continue
+                return cur.fetchall()
 
-            # Find the row(s) in the table with this s_no.
-            s_no_idx = self.columns.index("s_no")
-            target_rows = []
-            for row in range(self.ui.tableWidget.rowCount()):
-                item = self.ui.tableWidget.item(row, s_no_idx)
-                if item and item.text() == updated_s_no:
-                    target_rows.append(row)
-
-            # Update each matching row with new data.
-            for target_row in target_rows:
-                self.ui.tableWidget.blockSignals(True)
-                for col_idx, new_value in enumerate(row_data):
-                    item = self.ui.tableWidget.item(target_row, col_idx)
-                    if not item:
-                        from PyQt5.QtWidgets import QTableWidgetItem
-                        item = QTableWidgetItem("")
-                        self.ui.tableWidget.setItem(target_row, col_idx, item)
-                    item.setText("" if new_value is None else str(new_value))
-                self.ui.tableWidget.blockSignals(False)
+        self.async_db.run(
+            fetch_rows,
+            on_result=lambda rows: self._apply_notified_rows(rows, ids),
+            on_error=self._on_notified_rows_error
+        )
+
+    def _on_notified_rows_error(self, message):
+        # The rows would stay stale: catch up with a delta refresh instead
+        logger.error("Failed to fetch notified rows, falling back to a delta refresh: %s", message)
+        self.refresh_changes()
+
+    def _apply_notified_rows(self, rows, requested=()):
+        s_no_idx = self.columns.index("s_no")
+        if self._load_task is not None:
+            # Mid-load: refresh rows already streamed; the load itself brings the rest
+            for row_data in rows:
+                row = self.model.row_for_key(row_data[s_no_idx])
+                if row >= 0:
+                    self.model.set_row_values(row, row_data)
+            self._restore_pending_writes()
+            return
+        # Requested rows the scoped query no longer returns have left this dialog
+        # (deleted, or no longer matching the subcountry / server-side filters)
+        gone = set(requested) - {to_text(row_data[s_no_idx]) for row_data in rows}
+        if gone and self.model.remove_keys(gone):
+            self.filter_manager.resync_hidden_rows()
+        # O(1) lookups through the model's s_no index; rows inserted elsewhere are appended
+        updated, added = self.model.merge_rows(rows)
+        self._restore_pending_writes()
+        if not added:
+            return
+        self.apply_sno_filter(range(self.model.rowCount() - added, self.model.rowCount()))
+        if self.model.sort_columns:
+            self.model.sort_by(self.model.sort_columns)
+        if self.filter_manager._column_filters and not self.filter_manager.server_side:
+            self.filter_manager.apply_column_filters()
+
+    def _set_db_publishes_changes(self, installed):
+        self._db_publishes_changes = bool(installed)
+        if installed:
+            logger.info("Change triggers found on %s.%s; client NOTIFY disabled", self.schema, self.table)
 
     def handle_cell_changed(self, row, col):
         #import traceback
         #print("[DEBUG] handle_cell_changed called from:")
         #traceback.print_stack(limit=3)
-        item = self.ui.tableWidget.item(row, col)
-        if item is None:
-            #print(f"[DEBUG] handle_cell_changed: No item at ({row}, {col})")
+        if not (0 <= row < self.model.rowCount() and 0 <= col < len(self.columns)):
+            #print(f"[DEBUG] handle_cell_changed: No cell at ({row}, {col})")
             return
 
-        widget = self.ui.tableWidget.cellWidget(row, col)
-        if isinstance(widget, QComboBox):
-            new_value = widget.currentText()
-        else:
-            new_value = item.text()
+        # Native value: setData() already converted the edit to the column type
+        new_value = self.model.value(row, col)
 
         field_name = self.columns[col]
-        col_type = self.col_types.get(field_name, "").lower()
-
-        if (
-            new_value is None
-            or str(new_value).strip() == ""
-            or str(new_value).strip().lower() == "none"
-        ):
-            new_value = None
 
         # --- Use (s_no, col_name) as key for prev_value ---
-        s_no_item = self.ui.tableWidget.item(row, self.columns.index("s_no"))
-        if s_no_item:
-            s_no = s_no_item.text()
-            col_name = self.columns[col]
+        s_no = self.model.value(row, self.columns.index("s_no"))
+        col_name = self.columns[col]
+        if s_no:
             prev_value = self._cell_prev_values.get((s_no, col_name), "")
         else:
             prev_value = ""
@@ -715,34 +979,189 @@ class WorkAllocationPortalViewerDialog(QDialog):
             return
 
         if not getattr(self, "_is_undo_redo", False) and not getattr(self, "_is_group_paste", False):
-            if s_no_item:
+            if s_no:
                 self.undo_stack.push(CellEditCommand(self, s_no, col_name, prev_value, new_value))
 
         # --- Normal field update ---
-        if not s_no_item or not s_no_item.text():
+        if not s_no:
             #print(f"[DEBUG] handle_cell_changed: No s_no found for row {row}")
             return
 
-        s_no = s_no_item.text()
-        try:
+        payloads = [] if self._db_publishes_changes else self._change_payloads({s_no: {field_name: new_value}})
+        source = self._notify_source
+
+        def write(conn):
             #print(f"[DEBUG] handle_cell_changed: Updating DB: field={field_name}, value={new_value}, s_no={s_no}")
-            cur = self.db_handler.conn.cursor()
-            cur.execute(
-                f"UPDATE {self.quoted_table} SET {field_name} = %s WHERE s_no = %s",
-                (new_value, s_no)
-            )
-            self.db_handler.conn.commit()
-            cur.execute(f"NOTIFY production_inputs_update, '{s_no}';")
-            cur.close()
-            #print(f"[DEBUG] handle_cell_changed: DB update successful for s_no={s_no}, field={field_name}")
-        except Exception as e:
-            #print(f"[DEBUG] handle_cell_changed: DB update failed: {e}")
-            QMessageBox.critical(self, "Update Error", f"Failed to update {field_name}: {e}")
-            self.refresh_table()
+            with conn.cursor() as cur:
+                # Lets the change triggers tag the notification with our source id
+                cur.execute("SELECT set_config('wap.notify_source', %s, true)", (source,))
+                cur.execute(
+                    f"UPDATE {self.quoted_table} SET {field_name} = %s WHERE s_no = %s",
+                    (new_value, s_no)
+                )
+                # Delivered on commit, together with the UPDATE
+                for payload in payloads:
+                    cur.execute("SELECT pg_notify(%s, %s)", (self.notify_channel, payload))
+            conn.commit()
+
+        # Writes share one worker thread, so they reach the DB in edit order
+        self._run_write(
+            write,
+            [(s_no, field_name, new_value)],
+            on_error=lambda message: self._on_update_error(field_name, message)
+        )
 
         # --- Store new_value using (s_no, col_name) as key ---
-        if s_no_item:
-            self._cell_prev_values[(s_no, col_name)] = new_value
+        self._cell_prev_values[(s_no, col_name)] = new_value
+
+        fills = self._autofill_employee_names([(s_no, field_name, new_value)])
+        if fills:
+            self.write_cell_batch(fills)
+
+    def _autofill_employee_names(self, values):
+        """
+        For (s_no, col_name, value) edits of emp_id columns, fill the matching
+        empty name column (EMP_ID_TO_NAME_FIELD) from the employee directory.
+        Returns the (s_no, name_field, name) cells that were filled.
+        """
+        fills = []
+        for s_no, col_name, value in values:
+            name_field = EMP_ID_TO_NAME_FIELD.get(col_name)
+            if not name_field or value is None:
+                continue
+            row, col = self.find_cell(s_no, name_field)
+            if row is None or self.model.value(row, col):
+                continue
+            employee_name = self.employee_directory.name_for(value)
+            if employee_name:
+                self.model.set_value(row, col, employee_name)
+                fills.append((s_no, name_field, employee_name))
+        return fills
+
+    def _sql_cast(self, col_name, table_schema=None):
+        """Cast suffix turning a text literal into the column's type (enums and PostGIS types too)."""
+        if table_schema is None:
+            table_schema = self.db_handler.cached_table_schema(self.schema, self.table)
+        cast = table_schema.casts.get(col_name) if table_schema is not None else None
+        return f"::{cast}" if cast else ""
+
+    def write_cell_batch(self, values):
+        """
+        Write (s_no, col_name, value) cells in one transaction: one
+        UPDATE ... FROM (VALUES ...) per column, then one NOTIFY per payload
+        chunk carrying the new values. Used by paste, delete and undo/redo.
+        """
+        values = list(values)
+        values += self._autofill_employee_names(values)
+        by_column = {}
+        for s_no, col_name, value in values:
+            if not s_no:
+                continue
+            by_column.setdefault(col_name, {})[s_no] = value  # last write per cell wins
+            self._cell_prev_values[(s_no, col_name)] = value
+        if not by_column:
+            return
+
+        changes = {}
+        for col_name, cells in by_column.items():
+            for s_no, value in cells.items():
+                changes.setdefault(s_no, {})[col_name] = value
+        payloads = [] if self._db_publishes_changes else self._change_payloads(changes)
+        source = self._notify_source
+
+        def write(conn):
+            # Casts come from the (cached) table schema, so they are right even
+            # before the dialog has loaded col_types
+            table_schema = self.db_handler.get_table_schema(self.schema, self.table, conn)
+            s_no_cast = self._sql_cast("s_no", table_schema)
+            with conn.cursor() as cur:
+                cur.execute("SELECT set_config('wap.notify_source', %s, true)", (source,))
+                for col_name, cells in by_column.items():
+                    if all(value is None for value in cells.values()):
+                        # Bulk clear: no VALUES list needed, just the keys
+                        cur.execute(
+                            f"UPDATE {self.quoted_table} SET {col_name} = NULL "
+                            f"WHERE s_no = ANY(%s::text[]{s_no_cast and s_no_cast + '[]'})",
+                            ([str(s_no) for s_no in cells],)
+                        )
+                    else:
+                        execute_values(
+                            cur,
+                            f"UPDATE {self.quoted_table} AS t "
+                            f"SET {col_name} = v.val{self._sql_cast(col_name, table_schema)} "
+                            f"FROM (VALUES %s) AS v(s_no, val) WHERE t.s_no = v.s_no{s_no_cast}",
+                            list(cells.items()),
+                            page_size=1000
+                        )
+                # NOTIFY is queued inside the transaction and delivered on commit
+                # (nothing to send when the database triggers publish the change)
+                for payload in payloads:
+                    cur.execute("SELECT pg_notify(%s, %s)", (self.notify_channel, payload))
+            conn.commit()
+
+        label = ", ".join(by_column)
+        self._run_write(
+            write,
+            [(s_no, col_name, value) for col_name, cells in by_column.items() for s_no, value in cells.items()],
+            on_error=lambda message: self._on_update_error(label, message)
+        )
+
+    def _run_write(self, write, cells, on_error):
+        """Queue `write` on the write executor, tracking its (s_no, column, value) cells until it finishes."""
+        keys = []
+        for s_no, col_name, value in cells:
+            key = (to_text(s_no), col_name)
+            pending = self._pending_writes.setdefault(key, [0, None])
+            pending[0] += 1
+            pending[1] = value
+            keys.append(key)
+        task = self.async_db.run(write, on_error=on_error, write=True)
+        task.signals.finished.connect(lambda: self._write_finished(keys))
+
+    def _write_finished(self, keys):
+        for key in keys:
+            pending = self._pending_writes.get(key)
+            if pending is not None:
+                pending[0] -= 1
+                if pending[0] <= 0:
+                    del self._pending_writes[key]
+
+    def _restore_pending_writes(self):
+        """Put back the values of queued writes after server rows were merged into the model."""
+        for (s_no, col_name), (_, value) in self._pending_writes.items():
+            row, col = self.find_cell(s_no, col_name)
+            if row is not None and self.model.value(row, col) != value:
+                self.model.set_value(row, col, value)
+
+    def _subcountry_filter(self):
+        if self.subcountry and self.subcountry != "All subcountry":
+            return self.subcountry
+        return None
+
+    def _change_payloads(self, changes):
+        """NOTIFY payloads for {s_no: {column: value}}, grouped by the rows' subcountry."""
+        by_subcountry = {}
+        for s_no, values in changes.items():
+            subcountry = None
+            row, col = self.find_cell(s_no, "subcountry")
+            # A row moving between subcountries is announced without one, so both sides see it
+            if row is not None and "subcountry" not in values:
+                subcountry = self.model.value(row, col)
+            by_subcountry.setdefault(subcountry, {})[s_no] = values
+        table = f"{self.schema}.{self.table}"
+        return [
+            payload
+            for subcountry, rows in by_subcountry.items()
+            for payload in encode_changes(table, rows, self._notify_source, subcountry)
+        ]
+
+    def _on_edit_rejected(self, field_name, message):
+        QMessageBox.warning(self, "Invalid Value", f"Invalid value for '{field_name}': {message}")
+
+    def _on_update_error(self, field_name, message):
+        #print(f"[DEBUG] handle_cell_changed: DB update failed: {message}")
+        QMessageBox.critical(self, "Update Error", f"Failed to update {field_name}: {message}")
+        self.refresh_table()
    
     def copy_cell_values(self):
         """Copy only the values of selected cells to the clipboard, and store metadata mapping in memory."""
@@ -772,7 +1191,6 @@ class WorkAllocationPortalViewerDialog(QDialog):
 
         group_edits = []
         self._is_group_paste = True
-        s_no_idx = self.columns.index("s_no")
 
         num_clip_rows = len(rows)
         num_clip_cols = max(len(r) for r in rows) if rows else 1
@@ -781,7 +1199,9 @@ class WorkAllocationPortalViewerDialog(QDialog):
             row_in_clip = i // num_clip_cols % num_clip_rows
             col_in_clip = i % num_clip_cols
             new_value = rows[row_in_clip][col_in_clip % len(rows[row_in_clip])]
-            col_idx = self.columns.index(col_name)
+            row, col_idx = self.find_cell(s_no, col_name)
+            if row is None:
+                continue
 
             # --- Dropdown value validation ---
             if col_name in self.DROPDOWN_COLUMNS:
@@ -790,26 +1210,22 @@ class WorkAllocationPortalViewerDialog(QDialog):
                     continue  # Skip invalid value
             # ---------------------------------
 
-            for row in range(self.ui.tableWidget.rowCount()):
-                s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-                if s_no_item and s_no_item.text() == s_no:
-                    # Only paste if cell is editable
-                    if not self.is_cell_editable(row, col_idx):
-                        continue  # Skip non-editable cells
-                    item = self.ui.tableWidget.item(row, col_idx)
-                    if item is None:
-                        item = QTableWidgetItem("")
-                        self.ui.tableWidget.setItem(row, col_idx, item)
-                    old_value = item.text()
-                    item.setText(new_value)
-                    group_edits.append((s_no, col_name, old_value, new_value))
-                    self.handle_cell_changed(row, col_idx)
-                    break
+            # Only paste if cell is editable
+            if not self.is_cell_editable(row, col_idx):
+                continue  # Skip non-editable cells
+            # Skip values that do not fit the column type (e.g. text in a date column)
+            try:
+                self.model.coerce(col_idx, new_value)
+            except ValueError:
+                continue
+            old_value = self.model.value(row, col_idx)
+            group_edits.append((s_no, col_name, old_value, new_value))
 
         self._is_group_paste = False
 
         if group_edits:
             #print(f"[DEBUG] Pasted changes: {group_edits}")
+            # push() runs redo(), which applies the paste and writes it in one transaction
             self.undo_stack.push(GroupEditCommand(self, group_edits))
 
     def undo(self):
@@ -821,7 +1237,7 @@ class WorkAllocationPortalViewerDialog(QDialog):
         self.undo_stack.redo()
 
     def eventFilter(self, obj, event):
-        if obj == self.ui.tableWidget and event.type() == QEvent.KeyPress:
+        if obj == self.ui.tableView and event.type() == QEvent.KeyPress:
             key = event.key()
             modifiers = event.modifiers()
             if key == Qt.Key_C and modifiers & Qt.ControlModifier:
@@ -839,69 +1255,101 @@ class WorkAllocationPortalViewerDialog(QDialog):
                 self.redo()
                 return True
             elif key in (Qt.Key_Delete, Qt.Key_Backspace):
-                group_edits = []
-                self.ui.tableWidget.blockSignals(True)
-                for item in self.ui.tableWidget.selectedItems():
-                    row, col = item.row(), item.column()
-                    if self.is_cell_editable(row, col):
-                        prev_value = item.text()
-                        item.setText("")
-                        s_no_item = self.ui.tableWidget.item(row, self.columns.index("s_no"))
-                        if s_no_item:
-                            s_no = s_no_item.text()
-                            col_name = self.columns[col]
-                            group_edits.append((s_no, col_name, prev_value, ""))
-                self.ui.tableWidget.blockSignals(False)
-                if group_edits:
-                    self.undo_stack.push(GroupEditCommand(self, group_edits))
+                self.clear_selected_cells()
                 return True
         return super().eventFilter(obj, event)
 
+    def clear_selected_cells(self):
+        """Set every selected editable cell to NULL as a single undoable, batched write."""
+        group_edits = []
+        s_no_idx = self.model.column_of("s_no")
+        for index in self._selected_indexes():
+            row, col = index.row(), index.column()
+            if self.is_cell_editable(row, col):
+                prev_value = self.model.value(row, col)
+                s_no = self.model.value(row, s_no_idx)
+                if s_no and prev_value is not None:
+                    group_edits.append((s_no, self.columns[col], prev_value, ""))
+        if group_edits:
+            # push() runs redo(): one UPDATE ... SET col = NULL per column, one NOTIFY
+            self.undo_stack.push(GroupEditCommand(self, group_edits, "Clear Cells"))
+
+    def _on_header_sort_click(self, col):
+        if self.filter_manager.filter_mode_enabled:
+            return  # header clicks open the column filter instead
+        sort_columns = list(self.model.sort_columns)
+        flip = {Qt.AscendingOrder: Qt.DescendingOrder, Qt.DescendingOrder: Qt.AscendingOrder}
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier:
+            for i, (sort_col, order) in enumerate(sort_columns):
+                if sort_col == col:
+                    sort_columns[i] = (col, flip[order])
+                    break
+            else:
+                sort_columns.append((col, Qt.AscendingOrder))
+        elif sort_columns and sort_columns[0][0] == col:
+            sort_columns = [(col, flip[sort_columns[0][1]])]
+        else:
+            sort_columns = [(col, Qt.AscendingOrder)]
+        header = self.ui.tableView.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(*sort_columns[0])
+        self.model.sort_by(sort_columns)
+
     def sort_by_sno(self):
         if "s_no" in self.columns:
             s_no_idx = self.columns.index("s_no")
-            self.ui.tableWidget.sortItems(s_no_idx, Qt.AscendingOrder)
+            self.model.sort(s_no_idx, Qt.AscendingOrder)
     
     def cleanup_on_logout(self):
-        if hasattr(self, "pg_listener"):
+        self.cancel_loading()
+        self._notify_timer.stop()
+        self._pending_notify_ids = set()
+        self.async_db.cancel_all()
+        self._unsubscribe_notifications()
+
+    def _unsubscribe_notifications(self, *args):
+        """Stop receiving hub notifications (dialog closed or session ended)."""
+        for channel, slot in getattr(self, "_subscriptions", ()):
+            self.notification_hub.unsubscribe(channel, slot)
+        if getattr(self, "_subscriptions", None):
             try:
-                self.pg_listener.close()
-            except Exception as e:
-                print(f"Failed to close pg_listener: {e}")
+                self.notification_hub.reconnected.disconnect(self.refresh_changes)
+            except TypeError:
+                pass
+        self._subscriptions = []
     
     def load_column_types(self):
         if not self.columns:
             QMessageBox.critical(self, "Error", "No columns defined for the selected table.")
             return
 
-        cur = self.db_handler.conn.cursor()
-        format_str = ','.join(['%s'] * len(self.columns))
+        def on_column_types(col_types):
+            self.col_types = col_types
+            self.model.set_column_types(col_types)
+
+        # Cache hit: no round-trip, the dialog opens with types already known
+        cached = self.db_handler.cached_table_schema(self.schema, self.table)
+        if cached is not None:
+            on_column_types(self._column_types_from(cached))
+            return
+        self.async_db.run(self._query_column_types, on_result=on_column_types)
+
+    def _query_column_types(self, conn):
+        """Return {column_name: data_type} for self.columns (may run on a worker thread)."""
+        return self._column_types_from(self.db_handler.get_table_schema(self.schema, self.table, conn))
+
+    def _column_types_from(self, table_schema):
+        return {name: table_schema.types[name] for name in self.columns if name in table_schema.types}
 
-        query = """
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-            AND column_name IN ({})
-            ORDER BY ordinal_position
-        """.format(format_str)
+    def _on_schema_changed(self, payload):
+        self.db_handler.handle_schema_change(payload)
 
-        cur.execute(query, [self.schema, self.table] + self.columns)
-        self.col_types = {name: dtype for name, dtype in cur.fetchall()}
-        cur.close()
+    def _on_employees_changed(self, payload):
+        self.employee_directory.reload_async()
 
     def is_cell_editable(self, row, col):
-        field_name = self.columns[col]
-        # Build row_data as a dict of column_name: value for this row
-        row_data = {self.columns[c]: self.ui.tableWidget.item(row, c).text() for c in range(self.ui.tableWidget.columnCount())}
-        # Pass project name if available (set self.project in __init__ if needed)
-        return is_field_editable(
-            self.user_role,
-            field_name,
-            row_data,
-            getattr(self, "emp_id", None),
-            project=getattr(self, "project", None),
-            table_name=self.table_name  # <-- pass the table name!
-        )
+        # Cached per-row mask from the compiled permissions (see PortalTableModel)
+        return self.model.is_editable(row, col)
 
 
     class CheckableListWidget(QtWidgets.QListWidget):
@@ -921,8 +1369,8 @@ class WorkAllocationPortalViewerDialog(QDialog):
         """Display a dialog to let users reorder and show/hide columns."""
         # Show all columns, not just visible ones
         all_cols = [
-            self.ui.tableWidget.horizontalHeaderItem(i).text().replace(" ▼", "")
-            for i in range(self.ui.tableWidget.columnCount())
+            self.model.headerData(i, Qt.Horizontal).replace(" ▼", "")
+            for i in range(self.model.columnCount())
         ]
 
         dialog = QtWidgets.QDialog(self)
@@ -962,7 +1410,7 @@ class WorkAllocationPortalViewerDialog(QDialog):
                         | Qt.ItemIsSelectable
                     )
                     # Check if column is visible
-                    if not self.ui.tableWidget.isColumnHidden(i):
+                    if not self.ui.tableView.isColumnHidden(i):
                         item.setCheckState(Qt.Checked)
                     else:
                         item.setCheckState(Qt.Unchecked)
@@ -993,10 +1441,10 @@ class WorkAllocationPortalViewerDialog(QDialog):
 
         # Set visibility for all columns
         for i, col in enumerate(all_cols):
-            self.ui.tableWidget.setColumnHidden(i, not visibility.get(col, False))
+            self.ui.tableView.setColumnHidden(i, not visibility.get(col, False))
 
         # Reorder columns
-        header = self.ui.tableWidget.horizontalHeader()
+        header = self.ui.tableView.horizontalHeader()
         for target_idx, col_name in enumerate(new_order):
             current_idx = header.visualIndex(all_cols.index(col_name))
             header.moveSection(current_idx, target_idx)
@@ -1014,19 +1462,18 @@ class WorkAllocationPortalViewerDialog(QDialog):
     def zoom_to_selected_row_on_map(self):
         """Zoom QGIS map canvas to the geometry of the selected row in the table."""
         # Get the selected row
-        selected_items = self.ui.tableWidget.selectedItems()
-        if not selected_items:
+        selected_indexes = self._selected_indexes()
+        if not selected_indexes:
             QMessageBox.information(self, "Zoom", "Please select a row to zoom to.")
             return
 
         # Find the s_no of the selected row (assuming s_no is unique)
         s_no_idx = self.columns.index("s_no")
-        row = selected_items[0].row()
-        s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-        if not s_no_item:
+        row = selected_indexes[0].row()
+        s_no = self.model.value(row, s_no_idx)
+        if not s_no:
             QMessageBox.warning(self, "Zoom", "Could not determine the selected row's s_no.")
             return
-        s_no = s_no_item.text()
         print(f"[DEBUG] Zoom requested for s_no: {s_no}")
 
         # Use the stored QGIS layer reference
@@ -1076,39 +1523,37 @@ class WorkAllocationPortalViewerDialog(QDialog):
         iface.mapCanvas().setExtent(feature.geometry().boundingBox())
         iface.mapCanvas().refresh()
 
+    def find_cell(self, s_no, col_name):
+        """(row, col) of the cell for s_no/col_name via the model indexes, or (None, None)."""
+        row = self.model.row_for_key(s_no)
+        col = self.model.column_of(col_name)
+        if row < 0 or col < 0:
+            return None, None
+        return row, col
+
     def restore_selection_by_id(self, selected_cells):
         """Restore selection given a list of (s_no, col_name)."""
-        self.ui.tableWidget.clearSelection()
-        s_no_idx = self.columns.index("s_no")
-        for row in range(self.ui.tableWidget.rowCount()):
-            s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-            if not s_no_item:
-                continue
-            s_no = s_no_item.text()
-            for (sel_s_no, sel_col_name) in selected_cells:
-                if s_no == sel_s_no and sel_col_name in self.columns:
-                    col = self.columns.index(sel_col_name)
-                    item = self.ui.tableWidget.item(row, col)
-                    if item:
-                        item.setSelected(True)
+        selection_model = self.ui.tableView.selectionModel()
+        selection_model.clearSelection()
+        selection = QItemSelection()
+        for sel_s_no, sel_col_name in selected_cells:
+            row, col = self.find_cell(sel_s_no, sel_col_name)
+            if row is not None:
+                index = self.model.index(row, col)
+                selection.select(index, index)
+        if not selection.isEmpty():
+            selection_model.select(selection, QItemSelectionModel.Select)
 
     def filter_to_snos(self, s_no_list):
         """Show only rows with s_no in s_no_list. If list is empty, show nothing."""
-        if not hasattr(self, 'columns') or not hasattr(self.ui, 'tableWidget'):
+        if not hasattr(self, 'columns') or not hasattr(self, 'model'):
             return
         if "s_no" not in self.columns:
             return
         s_no_set = set(map(str, s_no_list))
-        s_no_idx = self.columns.index("s_no")
-        for row in range(self.ui.tableWidget.rowCount()):
-            s_no_item = self.ui.tableWidget.item(row, s_no_idx)
-            if not s_no_item or s_no_item.text() not in s_no_set:
-                self.ui.tableWidget.setRowHidden(row, True)
-            else:
-                self.ui.tableWidget.setRowHidden(row, False)
-        # If no selection, hide all rows
-        if not s_no_set:
-            for row in range(self.ui.tableWidget.rowCount()):
-                self.ui.tableWidget.setRowHidden(row, True)
-
+        self._sno_filter = s_no_set  # also applied to rows still being streamed in
+        visible_rows = {self.model.row_for_key(s_no) for s_no in s_no_set}
+        for row in range(self.model.rowCount()):
+            # An empty selection hides every row
+            self.ui.tableView.setRowHidden(row, row not in visible_rows)
 
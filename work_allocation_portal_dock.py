@@ -1,8 +1,9 @@
-from PyQt5.QtWidgets import QDockWidget, QWidget, QTableWidgetItem
+from PyQt5.QtWidgets import QDockWidget, QWidget
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt
 import os
 from .work_allocation_portal_viewer import Ui_Dialog
+from .portal_table_model import PortalTableModel
 
 class WorkAllocationPortalViewerDock(QDockWidget):
     def __init__(self, db_handler, iface, parent=None):
@@ -33,21 +34,15 @@ class WorkAllocationPortalViewerDock(QDockWidget):
         columns = [desc[0] for desc in cur.description]
         cur.close()
 
-        self.ui.tableWidget.setColumnCount(len(columns))
-        self.ui.tableWidget.setHorizontalHeaderLabels(columns)
-        self.ui.tableWidget.setRowCount(len(data))
-
-        for row_idx, row in enumerate(data):
-            for col_idx, value in enumerate(row):
-                self.ui.tableWidget.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+        # Row numbers come from the model's vertical header
+        self.model = PortalTableModel(columns, self)
+        self.model.load(data)
+        self.ui.tableView.setModel(self.model)
 
         # Hide geom column
         if "geom" in columns:
             geom_idx = columns.index("geom")
-            self.ui.tableWidget.setColumnHidden(geom_idx, True)
-
-        # Set vertical header numbers (row numbers)
-        self.ui.tableWidget.setVerticalHeaderLabels([str(i+1) for i in range(self.ui.tableWidget.rowCount())])
+            self.ui.tableView.setColumnHidden(geom_idx, True)
 
         # Add the dock widget to QGIS main window
         iface.addDockWidget(Qt.BottomDockWidgetArea, self)
@@ -18,520 +18,28 @@ class Ui_Dialog(object):
         self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
         self.verticalLayout.setObjectName("verticalLayout")
         self.verticalLayout.setContentsMargins(9, 50, 9, 9)  # (left, top, right, bottom)
-        self.tableWidget = QtWidgets.QTableWidget(Dialog)
-        self.tableWidget.setObjectName("tableWidget")
-        self.verticalLayout.addWidget(self.tableWidget)
-        self.tableWidget.setMouseTracking(True)
-        self.tableWidget.setTabletTracking(True)
-        self.tableWidget.setAcceptDrops(True)
-        self.tableWidget.setAutoFillBackground(True)
-        self.tableWidget.setProperty("showDropIndicator", True)
-        self.tableWidget.setDragEnabled(False)
-        self.tableWidget.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
-        self.tableWidget.setAlternatingRowColors(True)
-        self.tableWidget.setTextElideMode(QtCore.Qt.ElideMiddle)
-        self.tableWidget.setShowGrid(True)
-        self.tableWidget.setRowCount(2000)
-        self.tableWidget.setColumnCount(91)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(11, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(12, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(13, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(14, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(15, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(16, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(17, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(18, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(19, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(20, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(21, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(22, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(23, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(24, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(25, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(26, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(27, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(28, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(29, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(30, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(31, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(32, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(33, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(34, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(35, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(36, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(37, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(38, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(39, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(40, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(41, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(42, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(43, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(44, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(45, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(46, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(47, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(48, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(49, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(50, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(51, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(52, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(53, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(54, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(55, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(56, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(57, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(58, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(59, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(60, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(61, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(62, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(63, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(64, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(65, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(66, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(67, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(68, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(69, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(70, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(71, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(72, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(73, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(74, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(75, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(76, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(77, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(78, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(79, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(80, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(81, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(82, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(83, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(84, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(85, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(86, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(87, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(88, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(89, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(90, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(91, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(92, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(93, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(94, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(95, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(96, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(97, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(98, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(99, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(100, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(101, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(102, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(103, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(104, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(105, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(106, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(107, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(108, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(109, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(110, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(111, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(112, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(113, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(114, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(115, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(116, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(117, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(118, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(119, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(120, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(121, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(122, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(123, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(124, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(125, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(126, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(127, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(128, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(129, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(130, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(131, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(132, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(133, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(134, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(135, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(136, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(137, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(138, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(139, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(140, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(141, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(142, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(143, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(144, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(145, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(146, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(147, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(148, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(149, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(150, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(151, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(152, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(153, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(11, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(12, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(13, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(14, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(15, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(16, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(17, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(18, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(19, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(20, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(21, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(22, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(23, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(24, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(25, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(26, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(27, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(28, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(29, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(30, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(31, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(32, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(33, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(34, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(35, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(36, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(37, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(38, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(39, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(40, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(41, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(42, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(43, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(44, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(45, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(46, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(47, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(48, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(49, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(50, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(51, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(52, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(53, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(54, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(55, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(56, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(57, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(58, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(59, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(60, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(61, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(62, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(63, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(64, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(65, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(66, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(67, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(68, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(69, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(70, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(71, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(72, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(73, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(74, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(75, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(76, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(77, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(78, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(79, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(80, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(81, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(82, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(83, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(84, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(85, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(86, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(87, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(88, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(89, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(90, item)
-        self.tableWidget.horizontalHeader().setVisible(True)
-        self.tableWidget.horizontalHeader().setCascadingSectionResizes(False)
-        self.tableWidget.horizontalHeader().setHighlightSections(True)
-        self.tableWidget.horizontalHeader().setMinimumSectionSize(40)
-        self.tableWidget.horizontalHeader().setSortIndicatorShown(True)
-        self.tableWidget.horizontalHeader().setStretchLastSection(False)
-        self.tableWidget.verticalHeader().setVisible(True)
-        self.tableWidget.verticalHeader().setSortIndicatorShown(False)
-        self.tableWidget.verticalHeader().setStretchLastSection(False)
+        self.tableView = QtWidgets.QTableView(Dialog)
+        self.tableView.setObjectName("tableView")
+        self.verticalLayout.addWidget(self.tableView)
+        self.tableView.setMouseTracking(True)
+        self.tableView.setTabletTracking(True)
+        self.tableView.setAcceptDrops(True)
+        self.tableView.setAutoFillBackground(True)
+        self.tableView.setProperty("showDropIndicator", True)
+        self.tableView.setDragEnabled(False)
+        self.tableView.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
+        self.tableView.setAlternatingRowColors(True)
+        self.tableView.setTextElideMode(QtCore.Qt.ElideMiddle)
+        self.tableView.setShowGrid(True)
+        self.tableView.horizontalHeader().setVisible(True)
+        self.tableView.horizontalHeader().setCascadingSectionResizes(False)
+        self.tableView.horizontalHeader().setHighlightSections(True)
+        self.tableView.horizontalHeader().setMinimumSectionSize(40)
+        self.tableView.horizontalHeader().setSortIndicatorShown(True)
+        self.tableView.horizontalHeader().setStretchLastSection(False)
+        self.tableView.verticalHeader().setVisible(True)
+        self.tableView.verticalHeader().setSortIndicatorShown(False)
+        self.tableView.verticalHeader().setStretchLastSection(False)
         self.stackedWidget = QtWidgets.QStackedWidget(Dialog)
         self.stackedWidget.setGeometry(QtCore.QRect(-10, 10, 1061, 31))
         self.stackedWidget.setObjectName("stackedWidget")
@@ -584,494 +92,4 @@ class Ui_Dialog(object):
     def retranslateUi(self, Dialog):
         _translate = QtCore.QCoreApplication.translate
         Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
-        self.tableWidget.setSortingEnabled(True)
-        item = self.tableWidget.verticalHeaderItem(0)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(1)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(2)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(3)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(4)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(5)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(6)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(7)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(8)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(9)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(10)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(11)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(12)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(13)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(14)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(15)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(16)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(17)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(18)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(19)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(20)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(21)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(22)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(23)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(24)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(25)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(26)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(27)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(28)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(29)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(30)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(31)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(32)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(33)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(34)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(35)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(36)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(37)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(38)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(39)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(40)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(41)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(42)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(43)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(44)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(45)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(46)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(47)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(48)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(49)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(50)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(51)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(52)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(53)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(54)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(55)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(56)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(57)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(58)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(59)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(60)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(61)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(62)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(63)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(64)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(65)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(66)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(67)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(68)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(69)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(70)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(71)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(72)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(73)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(74)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(75)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(76)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(77)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(78)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(79)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(80)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(81)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(82)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(83)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(84)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(85)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(86)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(87)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(88)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(89)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(90)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(91)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(92)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(93)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(94)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(95)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(96)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(97)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(98)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(99)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(100)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(101)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(102)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(103)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(104)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(105)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(106)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(107)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(108)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(109)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(110)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(111)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(112)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(113)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(114)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(115)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(116)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(117)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(118)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(119)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(120)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(121)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(122)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(123)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(124)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(125)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(126)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(127)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(128)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(129)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(130)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(131)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(132)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(133)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(134)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(135)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(136)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(137)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(138)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(139)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(140)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(141)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(142)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(143)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(144)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(145)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(146)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(147)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(148)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(149)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(150)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(151)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(152)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.verticalHeaderItem(153)
-        item.setText(_translate("Dialog", "New Row"))
-        item = self.tableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("Dialog", "geom"))
-        item = self.tableWidget.horizontalHeaderItem(1)
-        item.setText(_translate("Dialog", "s_no"))
-        item = self.tableWidget.horizontalHeaderItem(2)
-        item.setText(_translate("Dialog", "wu_received_date"))
-        item = self.tableWidget.horizontalHeaderItem(3)
-        item.setText(_translate("Dialog", "work_unit_id"))
-        item = self.tableWidget.horizontalHeaderItem(4)
-        item.setText(_translate("Dialog", "length_mi"))
-        item = self.tableWidget.horizontalHeaderItem(5)
-        item.setText(_translate("Dialog", "subcountry"))
-        item = self.tableWidget.horizontalHeaderItem(6)
-        item.setText(_translate("Dialog", "rough_road_type"))
-        item = self.tableWidget.horizontalHeaderItem(7)
-        item.setText(_translate("Dialog", "rfdb_production_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(8)
-        item.setText(_translate("Dialog", "rfdb_production_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(9)
-        item.setText(_translate("Dialog", "rfdb_production_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(10)
-        item.setText(_translate("Dialog", "rfdb_production_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(11)
-        item.setText(_translate("Dialog", "rfdb_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(12)
-        item.setText(_translate("Dialog", "rfdb_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(13)
-        item.setText(_translate("Dialog", "rfdb_production_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(14)
-        item.setText(_translate("Dialog", "rfdb_production_status"))
-        item = self.tableWidget.horizontalHeaderItem(15)
-        item.setText(_translate("Dialog", "rfdb_production_actual_road_type"))
-        item = self.tableWidget.horizontalHeaderItem(16)
-        item.setText(_translate("Dialog", "rfdb_production_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(17)
-        item.setText(_translate("Dialog", "siloc_production_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(18)
-        item.setText(_translate("Dialog", "siloc_production_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(19)
-        item.setText(_translate("Dialog", "New Column"))
-        item = self.tableWidget.horizontalHeaderItem(20)
-        item.setText(_translate("Dialog", "siloc_production_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(21)
-        item.setText(_translate("Dialog", "siloc_production_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(22)
-        item.setText(_translate("Dialog", "siloc_production_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(23)
-        item.setText(_translate("Dialog", "siloc_production_sign_count"))
-        item = self.tableWidget.horizontalHeaderItem(24)
-        item.setText(_translate("Dialog", "siloc_production_autodetection_status"))
-        item = self.tableWidget.horizontalHeaderItem(25)
-        item.setText(_translate("Dialog", "siloc_production_status"))
-        item = self.tableWidget.horizontalHeaderItem(26)
-        item.setText(_translate("Dialog", "siloc_production_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(27)
-        item.setText(_translate("Dialog", "siloc_qc_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(28)
-        item.setText(_translate("Dialog", "siloc_qc_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(29)
-        item.setText(_translate("Dialog", "siloc_qc_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(30)
-        item.setText(_translate("Dialog", "siloc_qc_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(31)
-        item.setText(_translate("Dialog", "siloc_qc_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(32)
-        item.setText(_translate("Dialog", "siloc_qc_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(33)
-        item.setText(_translate("Dialog", "siloc_qc_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(34)
-        item.setText(_translate("Dialog", "New Column"))
-        item = self.tableWidget.horizontalHeaderItem(35)
-        item.setText(_translate("Dialog", "siloc_qc_status"))
-        item = self.tableWidget.horizontalHeaderItem(36)
-        item.setText(_translate("Dialog", "siloc_qc_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(37)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(38)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(39)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(40)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(41)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(42)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(43)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(44)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_status"))
-        item = self.tableWidget.horizontalHeaderItem(45)
-        item.setText(_translate("Dialog", "rfdb_path_association_production_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(46)
-        item.setText(_translate("Dialog", "rfdb_qc_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(47)
-        item.setText(_translate("Dialog", "rfdb_qc_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(48)
-        item.setText(_translate("Dialog", "rfdb_qc_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(49)
-        item.setText(_translate("Dialog", "rfdb_qc_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(50)
-        item.setText(_translate("Dialog", "rfdb_qc_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(51)
-        item.setText(_translate("Dialog", "rfdb_qc_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(52)
-        item.setText(_translate("Dialog", "rfdb_qc_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(53)
-        item.setText(_translate("Dialog", "rfdb_qc_status"))
-        item = self.tableWidget.horizontalHeaderItem(54)
-        item.setText(_translate("Dialog", "rfdb_qc_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(55)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(56)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(57)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(58)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(59)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(60)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(61)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(62)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_status"))
-        item = self.tableWidget.horizontalHeaderItem(63)
-        item.setText(_translate("Dialog", "rfdb_attri_qc_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(64)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(65)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(66)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(67)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(68)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(69)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_status"))
-        item = self.tableWidget.horizontalHeaderItem(70)
-        item.setText(_translate("Dialog", "rfdb_roadtype_qc_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(71)
-        item.setText(_translate("Dialog", "rfdb_qa_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(72)
-        item.setText(_translate("Dialog", "rfdb_qa_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(73)
-        item.setText(_translate("Dialog", "rfdb_qa_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(74)
-        item.setText(_translate("Dialog", "rfdb_qa_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(75)
-        item.setText(_translate("Dialog", "rfdb_qa_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(76)
-        item.setText(_translate("Dialog", "rfdb_qa_status"))
-        item = self.tableWidget.horizontalHeaderItem(77)
-        item.setText(_translate("Dialog", "rfdb_qa_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(78)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_team_leader_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(79)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_team_leader_emp_name"))
-        item = self.tableWidget.horizontalHeaderItem(80)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_emp_id"))
-        item = self.tableWidget.horizontalHeaderItem(81)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_done_by"))
-        item = self.tableWidget.horizontalHeaderItem(82)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_allotted_date"))
-        item = self.tableWidget.horizontalHeaderItem(83)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_completed_date"))
-        item = self.tableWidget.horizontalHeaderItem(84)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_time_taken"))
-        item = self.tableWidget.horizontalHeaderItem(85)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_status"))
-        item = self.tableWidget.horizontalHeaderItem(86)
-        item.setText(_translate("Dialog", "rfdb_path_association_qc_remarks"))
-        item = self.tableWidget.horizontalHeaderItem(87)
-        item.setText(_translate("Dialog", "rfdb_qc_actual_road_type"))
-        item = self.tableWidget.horizontalHeaderItem(88)
-        item.setText(_translate("Dialog", "delivery_status"))
-        item = self.tableWidget.horizontalHeaderItem(89)
-        item.setText(_translate("Dialog", "delivered_date"))
-        item = self.tableWidget.horizontalHeaderItem(90)
-        item.setText(_translate("Dialog", "last_updated"))
+        self.tableView.setSortingEnabled(True)